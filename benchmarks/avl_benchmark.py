@@ -0,0 +1,233 @@
+"""
+Throughput benchmark for the AVLTreeController operations.
+
+Measures insert, search, delete, range_query, the three traversals and
+load_from_list on sequential, random and adversarial key orders, and reports
+ops/sec, peak memory and tree height. Results can be saved as JSON and
+compared against a previous run to catch regressions.
+
+Runs headless (obstacles do not load sprites). From the repository root:
+
+    python -m benchmarks.avl_benchmark --sizes 1000 10000 --output results.json
+    python -m benchmarks.avl_benchmark --sizes 1000 10000 --baseline results.json --threshold 0.15
+
+The default sizes stop at 10^5; add 1000000 to --sizes for the full run,
+which takes around half an hour.
+"""
+import argparse
+import io
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+from benchmarks.node_storage import make_obstacle_data, timed
+from controllers.avl_tree_controller import AVLTreeController
+from models.avl_tree import AVLTree, CompactAVLNode
+
+ORDERS = ("sequential", "random", "adversarial")
+OPERATIONS = ("load_from_list", "insert", "search", "range_query",
+              "inorder", "preorder", "postorder", "delete")
+RANGE_QUERIES = 1000
+RANGE_WIDTH = 700  # About 100 obstacles per window (keys are 7 px apart)
+
+
+def order_data(data, order, seed=0):
+    """
+    Arrange obstacle data in one of the benchmark key orders.
+
+    Sequential sorts by x1, which makes every insert land on the rightmost
+    path. Adversarial alternates the smallest and largest remaining keys, so
+    each insert falls between the two previous ones and needs double
+    rotations to rebalance.
+
+    Args:
+        data (list[dict]): Obstacle data with unique (x1, y1) keys.
+        order (str): One of ORDERS.
+        seed (int, optional): Random seed for the random order. Defaults to 0.
+
+    Returns:
+        list[dict]: The same obstacles in the requested order.
+    """
+    ordered = sorted(data, key=lambda item: (item["x1"], item["y1"]))
+    if order == "sequential":
+        return ordered
+    if order == "random":
+        random.Random(seed).shuffle(ordered)
+        return ordered
+    if order == "adversarial":
+        result = []
+        low, high = 0, len(ordered) - 1
+        while low <= high:
+            result.append(ordered[low])
+            if low != high:
+                result.append(ordered[high])
+            low, high = low + 1, high - 1
+        return result
+    raise ValueError(f"Unknown key order: {order}")
+
+
+def new_controller():
+    """
+    Return a controller over an empty tree with the game's node store.
+    Snapshots are never published here, so change tracking is off and only
+    the tree is measured.
+    """
+    controller = AVLTreeController(AVLTree(node_class=CompactAVLNode))
+    controller.set_change_tracking(False)
+    return controller
+
+
+def tree_height(controller):
+    """Return the height of the controller's tree (0 if empty)."""
+    root = controller.tree.get_root()
+    return root.get_height() if root is not None else 0
+
+
+def build_peak_memory(data):
+    """Return the peak bytes allocated while building a tree from data."""
+    tracemalloc.start()
+    controller = new_controller()
+    with redirect_stdout(io.StringIO()):
+        controller.load_from_list(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del controller
+    return peak
+
+
+def run(data, seed=0):
+    """
+    Measure every operation on one dataset.
+
+    Args:
+        data (list[dict]): Obstacle data, in insertion order.
+        seed (int, optional): Random seed for probes and query windows. Defaults to 0.
+
+    Returns:
+        dict: Tree height, peak build memory and ops/sec of every operation.
+    """
+    rng = random.Random(seed)
+    size = len(data)
+    keys = [(item["x1"], item["y1"]) for item in data]
+    probes = keys[:]
+    rng.shuffle(probes)
+    span = max(item["x2"] for item in data)
+    windows = [rng.uniform(0, max(span - RANGE_WIDTH, 0)) for _ in range(RANGE_QUERIES)]
+
+    seconds = {}
+    # Insertions print a warning for duplicates; keep the output readable
+    with redirect_stdout(io.StringIO()):
+        seconds["load_from_list"] = timed(new_controller().load_from_list, data)
+        controller = new_controller()
+        seconds["insert"] = timed(lambda: [controller.insert(item) for item in data])
+    height = tree_height(controller)
+
+    seconds["search"] = timed(lambda: [controller.search(x1, y1) for x1, y1 in probes])
+    root = controller.tree.get_root()
+    seconds["range_query"] = timed(
+        lambda: [controller.range_query(root, x, x + RANGE_WIDTH, 0, 800) for x in windows])
+    seconds["inorder"] = timed(controller.inorder)
+    seconds["preorder"] = timed(controller.preorder)
+    seconds["postorder"] = timed(controller.postorder)
+    with redirect_stdout(io.StringIO()):
+        seconds["delete"] = timed(lambda: [controller.delete(x1, y1) for x1, y1 in keys])
+
+    counts = {op: size for op in OPERATIONS}
+    counts["range_query"] = RANGE_QUERIES
+    return {
+        "height": height,
+        "peak_memory_bytes": build_peak_memory(data),
+        "ops_per_sec": {op: counts[op] / max(seconds[op], 1e-9) for op in OPERATIONS},
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Find the measurements that got worse than the baseline by more than threshold.
+
+    Throughput regresses when it drops below (1 - threshold) of the baseline;
+    peak memory regresses when it grows above (1 + threshold) of it. Cases
+    missing from either run are ignored.
+
+    Args:
+        results (list[dict]): Current results, as produced by main.
+        baseline (list[dict]): Baseline results in the same format.
+        threshold (float): Allowed relative change, e.g. 0.1 for 10%.
+
+    Returns:
+        list[str]: One description per regression (empty if none).
+    """
+    previous = {(case["size"], case["order"]): case for case in baseline}
+    regressions = []
+    for case in results:
+        old = previous.get((case["size"], case["order"]))
+        if old is None:
+            continue
+        label = f"{case['size']} {case['order']}"
+        for op, ops in case["ops_per_sec"].items():
+            old_ops = old["ops_per_sec"].get(op)
+            if old_ops and ops < old_ops * (1 - threshold):
+                regressions.append(f"{label} {op}: {ops:,.0f} ops/s vs {old_ops:,.0f} "
+                                   f"({ops / old_ops - 1:+.1%})")
+        old_peak = old.get("peak_memory_bytes")
+        if old_peak and case["peak_memory_bytes"] > old_peak * (1 + threshold):
+            regressions.append(f"{label} peak memory: {case['peak_memory_bytes']:,} B vs {old_peak:,} "
+                               f"({case['peak_memory_bytes'] / old_peak - 1:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--orders", nargs="+", choices=ORDERS, default=list(ORDERS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="save the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="allowed relative slowdown before reporting a regression (default 0.1)")
+    args = parser.parse_args()
+
+    header = (f"{'nodes':>8} {'order':<12} {'height':>6} {'peak MB':>8} "
+              + " ".join(f"{op:>14}" for op in OPERATIONS))
+    print("ops/sec")
+    print(header)
+    print("-" * len(header))
+    results = []
+    for size in args.sizes:
+        data = make_obstacle_data(size, args.seed)
+        for order in args.orders:
+            case = {"size": size, "order": order, **run(order_data(data, order, args.seed), args.seed)}
+            results.append(case)
+            print(f"{size:>8} {order:<12} {case['height']:>6} {case['peak_memory_bytes'] / 2 ** 20:>8.1f} "
+                  + " ".join(f"{case['ops_per_sec'][op]:>14,.0f}" for op in OPERATIONS))
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": args.seed,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"⚠️ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Frame-time benchmark of the game and tree views on synthetic levels.
+
+Builds levels of increasing size, drives a fixed number of frames through
+the game loop under the SDL dummy video driver and reports the frame-time
+distribution of every phase, plus the share of each frame spent on the
+road, the obstacles, the car, the UI and the tree panel. The tree is
+rendered in the frame loop instead of on the render thread, so its cost is
+measured in the same frames.
+
+From the repository root:
+
+    python -m benchmarks.frame_benchmark --sizes 100 1000 10000 100000 --frames 600
+"""
+import argparse
+import io
+import json
+import os
+from contextlib import redirect_stdout
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.node_storage import make_obstacle_data
+from controllers.avl_tree_controller import AVLTreeController
+from controllers.input_source import NullInput
+from models.avl_tree import AVLTree, CompactAVLNode
+from utils.file_admin import read_json
+from utils.frame_profiler import FrameProfiler
+from views.game_coordinator import GameCoordinator
+
+# Profiled phases behind each part of the screen
+GROUPS = {
+    "road": ("draw_road",),
+    "obstacles": ("update_obstacles", "cleanup", "draw_obstacles"),
+    "car": ("input", "draw_car"),
+    "ui": ("draw_ui",),
+    "tree": ("publish", "tree_render", "draw_tree"),
+}
+
+
+def build_level(size, seed=0):
+    """
+    Build a synthetic level: size obstacles 7 px apart, in random lanes.
+
+    Args:
+        size (int): Number of obstacles.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        AVLTreeController: Controller holding the level's obstacles.
+    """
+    controller = AVLTreeController(AVLTree(node_class=CompactAVLNode))
+    controller.bulk_load(make_obstacle_data(size, seed))
+    return controller
+
+
+def run(config, size, frames, seed=0):
+    """
+    Drive frames frames of one synthetic level, one simulation tick per frame.
+
+    The car's energy is refilled every frame and the road does not end
+    within the run, so every frame scrolls and draws the same kind of work.
+
+    Args:
+        config (dict): Game configuration.
+        size (int): Number of obstacles in the level.
+        frames (int): Frames to run.
+        seed (int, optional): Random seed of the level. Defaults to 0.
+
+    Returns:
+        FrameProfiler: Timings of every frame.
+    """
+    config = dict(config, road_length=10 ** 9)
+    coordinator = GameCoordinator(config, build_level(size, seed), input_source=NullInput(), headless=True)
+    game_view, tree_view = coordinator.game_view, coordinator.tree_view
+    controller = coordinator.avl_controller
+    controller.set_change_tracking(True)  # Headless turns it off, but this loop publishes
+
+    # First tree image and full screen, outside the measured frames
+    tree_view.submit_snapshot(controller.publish_snapshot())
+    tree_view.render_pending()
+    game_view.draw_game_area(full=True)
+    tree_view.draw_tree_area(full=True)
+    pygame.display.flip()
+
+    profiler = FrameProfiler(size=frames)
+    coordinator.profiler = game_view.profiler = profiler
+    for _ in range(frames):
+        game_view.car.set_energy(100)
+        frame_start = profiler.now()
+        coordinator.step()
+
+        t = profiler.now()
+        tree_view.submit_snapshot(controller.publish_snapshot())
+        t = profiler.record("publish", t)
+        if tree_view.dirty or tree_view.render_event.is_set():
+            tree_view.dirty = False
+            tree_view.render_event.clear()
+            tree_view.render_pending()
+            t = profiler.record("tree_render", t)
+
+        rects = game_view.draw_game_area()
+        t = profiler.record("draw_game", t)
+        rects += tree_view.draw_tree_area()
+        t = profiler.record("draw_tree", t)
+        pygame.display.update(rects)
+        profiler.record("flip", t)
+        profiler.record("frame", frame_start)
+    return profiler
+
+
+def summarize(profiler, frames):
+    """
+    Summarize the timings of a run.
+
+    Args:
+        profiler (FrameProfiler): Timings of the run.
+        frames (int): Frames that were run.
+
+    Returns:
+        dict: p50/p95/p99 in ms per phase, and the mean ms per frame and
+        share of the frame time of every group in GROUPS.
+    """
+    phases = {phase: dict(zip(("p50", "p95", "p99"), profiler.percentiles(phase)))
+              for phase in profiler.phases()}
+    frame_ms = sum(profiler.samples("frame"))
+    groups = {}
+    for group, members in GROUPS.items():
+        total = sum(sum(profiler.samples(phase)) for phase in members)
+        groups[group] = {"mean_ms": total / frames, "share": total / frame_ms if frame_ms else 0.0}
+    return {"phases": phases, "groups": groups}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="save the results to this JSON file")
+    args = parser.parse_args()
+
+    pygame.init()
+    config = read_json("config/settings.json")["config"]
+    results = []
+    for size in args.sizes:
+        # Cleanup and tree messages would flood the report
+        with redirect_stdout(io.StringIO()):
+            profiler = run(config, size, args.frames, args.seed)
+        summary = summarize(profiler, args.frames)
+        results.append({"size": size, "frames": args.frames, **summary})
+
+        print(f"\n{size} obstacles, {args.frames} frames")
+        print(f"{'phase (ms)':<18} {'p50':>8} {'p95':>8} {'p99':>8}")
+        for phase, ranks in summary["phases"].items():
+            print(f"{phase:<18} {ranks['p50']:>8.3f} {ranks['p95']:>8.3f} {ranks['p99']:>8.3f}")
+        print("per frame: " + ", ".join(f"{group} {values['mean_ms']:.3f} ms ({values['share']:.0%})"
+                                       for group, values in summary["groups"].items()))
+    pygame.quit()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
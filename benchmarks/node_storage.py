@@ -0,0 +1,121 @@
+"""
+Memory and speed comparison between the AVLNode and CompactAVLNode stores.
+
+Runs headless (obstacles do not load sprites). From the repository root:
+
+    python -m benchmarks.node_storage --sizes 1000 10000 100000
+"""
+import argparse
+import io
+import random
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+from controllers.avl_tree_controller import AVLTreeController
+from models.avl_tree import AVLNode, AVLTree, CompactAVLNode
+from models.obstacle import Obstacle
+
+OBSTACLE_TYPES = ("rock", "cone", "oil")
+
+
+def make_obstacle_data(count, seed=0):
+    """
+    Generate obstacle dictionaries with unique (x1, y1) keys in random order.
+
+    Args:
+        count (int): Number of obstacles.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        list[dict]: Obstacle data in the same format as config/obstacles.json.
+    """
+    rng = random.Random(seed)
+    data = []
+    for i in range(count):
+        kind = rng.choice(OBSTACLE_TYPES)
+        x1, y1 = i * 7, rng.randint(0, 700)
+        data.append({
+            "type": kind,
+            "sprite": f"views/assets/{kind}.png",
+            "x1": x1, "y1": y1,
+            "x2": x1 + rng.randint(40, 70), "y2": y1 + rng.randint(40, 60),
+        })
+    rng.shuffle(data)
+    return data
+
+
+def node_memory(node_class, obstacles):
+    """Return the bytes allocated per node when wrapping the given obstacles."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [node_class(obstacle) for obstacle in obstacles]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del nodes
+    return allocated / max(len(obstacles), 1)
+
+
+def timed(func, *args):
+    """Run func(*args) and return the elapsed wall time in seconds."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def new_controller(node_class):
+    """
+    Return a controller over an empty tree of node_class. Snapshots are never
+    published here, so change tracking is off and only the tree is measured.
+    """
+    controller = AVLTreeController(AVLTree(node_class=node_class))
+    controller.set_change_tracking(False)
+    return controller
+
+
+def run(node_class, data, probes):
+    """
+    Measure one node store on a dataset.
+
+    Returns:
+        dict: Bytes per node and seconds for bulk_load, insert and search.
+    """
+    obstacles = [Obstacle(item) for item in data]
+
+    bulk = new_controller(node_class)
+    bulk_time = timed(bulk.bulk_load, data)
+
+    incremental = new_controller(node_class)
+    with redirect_stdout(io.StringIO()):
+        insert_time = timed(lambda: [incremental.insert(item) for item in data])
+
+    search_time = timed(lambda: [bulk.search(x1, y1) for x1, y1 in probes])
+
+    return {
+        "bytes_per_node": node_memory(node_class, obstacles),
+        "bulk_load_s": bulk_time,
+        "insert_s": insert_time,
+        "search_s": search_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    header = f"{'nodes':>8} {'store':<15} {'B/node':>8} {'bulk_load':>10} {'insert':>10} {'search':>10}"
+    print(header)
+    print("-" * len(header))
+    for size in args.sizes:
+        data = make_obstacle_data(size, args.seed)
+        probes = [(item["x1"], item["y1"]) for item in data]
+        for node_class in (AVLNode, CompactAVLNode):
+            result = run(node_class, data, probes)
+            print(f"{size:>8} {node_class.__name__:<15} {result['bytes_per_node']:>8.0f} "
+                  f"{result['bulk_load_s']:>9.3f}s {result['insert_s']:>9.3f}s {result['search_s']:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 import pygame
+from utils.text_cache import get_font, render_text
 
 class Button:
     def __init__(self, x, y, width, height, text, font_size=24, bg_color=(50, 50, 50), text_color=(255, 255, 255)):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
-        self.font = pygame.font.Font(None, font_size)
+        self.font_size = font_size
+        self.font = get_font(None, font_size)
         self.bg_color = bg_color
         self.text_color = text_color
         self.hovered = False
@@ -15,8 +17,8 @@ class Button:
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, (255, 255, 255), self.rect, 2)  # borde
 
-        # Texto centrado
-        text_surf = self.font.render(self.text, True, self.text_color)
+        # Texto centrado (rendered once, shared through the text cache)
+        text_surf = render_text(self.text, self.font_size, self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
 
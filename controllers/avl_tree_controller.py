@@ -1,10 +1,18 @@
 from models.avl_tree import AVLNode, AVLTree
 from models.obstacle import Obstacle
+from models.tree_snapshot import SnapshotNode, TreeSnapshot
 
 class AVLTreeController:
     """
     Controller for managing an AVL tree of obstacles.
     Provides insertion, deletion, search, traversal, rebalancing, and range queries.
+
+    Every structural change bumps version, and publish_snapshot hands other
+    threads an immutable copy of the tree shape to draw from. Snapshots are
+    persistent: only the paths to nodes changed since the previous one are
+    copied, the unchanged subtrees are shared with it. Callers that never
+    publish (headless runs) turn the change tracking this needs off with
+    set_change_tracking.
     """
 
     def __init__(self, tree):
@@ -15,6 +23,92 @@ class AVLTreeController:
             tree (AVLTree): The AVL tree instance to manage.
         """
         self.tree = tree
+        self._removed_keys = set()  # Keys deleted since the last snapshot
+        self.version = 0  # Incremented on every structural change
+        self._published_version = None  # Version of the last published snapshot
+        self._dirty_nodes = set()  # Live nodes whose children or height changed since the last snapshot
+        self._snapshots = {}  # Key -> SnapshotNode of the last published snapshot
+        self._tracking = True  # Record the changes publish_snapshot needs
+
+    def set_change_tracking(self, enabled):
+        """
+        Turn the recording of changes on or off. Without publish_snapshot
+        draining them (e.g. a headless run), the dirty nodes and removed keys
+        would grow with every mutation, so they are dropped and the version is
+        the only thing kept up to date.
+
+        Turning the tracking back on makes the next publish_snapshot a full
+        copy of the tree.
+
+        Args:
+            enabled (bool): Whether to record changes.
+        """
+        self._tracking = enabled
+        self._removed_keys = set()
+        self._dirty_nodes = set()
+        self._snapshots = {}
+        if enabled:
+            self._published_version = None
+
+    def _record_change(self):
+        """Record that the tree changed shape: bump the version."""
+        self.version += 1
+
+    def _record_removed(self, keys):
+        """Record the (x1, y1) keys of deleted nodes."""
+        if self._tracking:
+            self._removed_keys.update(keys)
+
+    def _mark_dirty(self, node):
+        """Record that a node's children or height changed, so the next snapshot copies it."""
+        if self._tracking:
+            self._dirty_nodes.add(node)
+
+    def publish_snapshot(self):
+        """
+        Publish an immutable copy of the tree if it changed since the last call.
+
+        Must be called from the thread that mutates the tree, after a batch of
+        mutations. Publishing costs O(changes * log n): see _snapshot_nodes.
+
+        Returns:
+            TreeSnapshot | None: The new snapshot, or None if nothing changed.
+        """
+        if self.version == self._published_version:
+            return None
+        self._published_version = self.version
+        for key in self._removed_keys:
+            self._snapshots.pop(key, None)
+        self._removed_keys = set()
+        return TreeSnapshot(self.version, self._snapshot_nodes())
+
+    def _snapshot_nodes(self):
+        """
+        Copy the keys and shape of the tree into SnapshotNodes; return the root copy.
+
+        Path copying: the dirty nodes and their ancestors get new copies, every
+        other subtree reuses its copy from the previous snapshot.
+        """
+        copy_path = set()
+        for node in self._dirty_nodes:
+            while node is not None and node not in copy_path:
+                copy_path.add(node)
+                node = node.get_parent()
+        self._dirty_nodes = set()
+        return self._snapshot_subtree(self.tree.get_root(), copy_path)
+
+    def _snapshot_subtree(self, node, copy_path):
+        """Recursive helper for _snapshot_nodes: return the SnapshotNode of node's subtree."""
+        if node is None:
+            return None
+        key = (node.get_x1(), node.get_y1())
+        if node not in copy_path and key in self._snapshots:
+            return self._snapshots[key]
+        copy = SnapshotNode(key[0], key[1], node.get_height(),
+                            self._snapshot_subtree(node.get_left(), copy_path),
+                            self._snapshot_subtree(node.get_right(), copy_path))
+        self._snapshots[key] = copy
+        return copy
 
     def _height(self, node):
         """Return the height of the node, or 0 if None."""
@@ -23,13 +117,28 @@ class AVLTreeController:
         return node.get_height()
 
     def _update_height(self, node):
-        """Update the height of the node based on its children's heights."""
+        """
+        Update the height of the node based on its children's heights,
+        together with the bounding box of its subtree.
+        """
         if node is None:
             return
-        left_height = self._height(node.get_left())
-        right_height = self._height(node.get_right())
+        self._mark_dirty(node)
+        left, right = node.get_left(), node.get_right()
+        left_height = self._height(left)
+        right_height = self._height(right)
         node.set_height(1 + max(left_height, right_height))
 
+        min_x, max_x = node.get_x1(), node.get_x2()
+        min_y, max_y = node.get_y1(), node.get_y2()
+        for child in (left, right):
+            if child is not None:
+                min_x = min(min_x, child.get_min_x())
+                max_x = max(max_x, child.get_max_x())
+                min_y = min(min_y, child.get_min_y())
+                max_y = max(max_y, child.get_max_y())
+        node.set_bounds(min_x, max_x, min_y, max_y)
+
     def _balance_factor(self, node):
         """Calculate the balance factor of the node: left_height - right_height."""
         if node is None:
@@ -74,9 +183,11 @@ class AVLTreeController:
         if node is not None:
             print(f"⚠️ Obstacle at ({obstacle_obj.rect.left}, {obstacle_obj.rect.top}) already exists.")
             return
-        new_node = AVLNode(obstacle_obj)
+        new_node = self.tree.create_node(obstacle_obj)
         if self.tree.get_root() is None:
             self.tree.set_root(new_node)
+            self._mark_dirty(new_node)
+            self._record_change()
         else:
             root = self.tree.get_root()
             root = self._insert(root, new_node, parent=None)
@@ -86,6 +197,8 @@ class AVLTreeController:
         """Recursive helper for insertion, with rebalancing."""
         if root is None:
             new_node.set_parent(parent)
+            self._mark_dirty(new_node)
+            self._record_change()
             return new_node
         if new_node.get_x1() < root.get_x1() or (
                 new_node.get_x1() == root.get_x1() and new_node.get_y1() < root.get_y1()):
@@ -102,14 +215,19 @@ class AVLTreeController:
             print(f"⚠️ Node at ({x1}, {y1}) not found.")
             return
         self._delete(node)
+        self._record_removed([(x1, y1)])
 
     def _delete(self, node: AVLNode):
         """Helper for deletion handling all cases (0, 1, 2 children)."""
+        # Lowest node whose subtree changed; heights and bounds are fixed from there up
+        rebalance_from = node.get_parent()
         if node.get_left() is None and node.get_right() is None:
             self._replace_node(node, None)
         elif node.get_left() is not None and node.get_right() is not None:
             predecessor = self._get_predecessor(node)
+            rebalance_from = predecessor
             if predecessor.get_parent() != node:
+                rebalance_from = predecessor.get_parent()
                 self._replace_node(predecessor, predecessor.get_left())
                 predecessor.set_left(node.get_left())
                 if predecessor.get_left():
@@ -121,7 +239,7 @@ class AVLTreeController:
         else:
             child = node.get_left() if node.get_left() else node.get_right()
             self._replace_node(node, child)
-        self._rebalance_upwards(node.get_parent())
+        self._rebalance_upwards(rebalance_from)
 
     def _rebalance(self, node):
         """Check balance factor and apply rotations if needed."""
@@ -148,6 +266,7 @@ class AVLTreeController:
     def _replace_node(self, old_node, new_node):
         """Replace old_node with new_node, updating parent references."""
         parent = old_node.get_parent()
+        self._record_change()
         if parent is None:
             self.tree.set_root(new_node)
         elif old_node == parent.get_left():
@@ -172,6 +291,7 @@ class AVLTreeController:
         node.set_left(T3)
         y.set_parent(node.get_parent())
         node.set_parent(y)
+        self._record_change()
         if T3:
             T3.set_parent(node)
         if y.get_parent():
@@ -193,6 +313,7 @@ class AVLTreeController:
         node.set_right(T2)
         y.set_parent(node.get_parent())
         node.set_parent(y)
+        self._record_change()
         if T2:
             T2.set_parent(node)
         if y.get_parent():
@@ -206,44 +327,224 @@ class AVLTreeController:
         self._update_height(y)
         return y
 
-    def postorder(self):
-        """Return a list of nodes in postorder traversal."""
-        return self._postorder(self.tree.get_root())
+    def split_before(self, x):
+        """
+        Remove every obstacle whose x1 is lower than x.
 
-    def _postorder(self, node):
-        if node is None:
+        The tree is split around x with AVL split/join in O(log n), so the
+        whole batch is evicted at once instead of one delete per obstacle.
+
+        Args:
+            x (int): Threshold; nodes with x1 < x are removed.
+
+        Returns:
+            list[Obstacle]: The removed obstacles in (x1, y1) order.
+        """
+        lower, upper = self._split(self.tree.get_root(), x)
+        self.tree.set_root(upper)
+        if lower is None:
             return []
-        return self._postorder(node.get_left()) + self._postorder(node.get_right()) + [
-            f"({node.get_x1()}, {node.get_y1()})"]
+        removed = [node.get_obstacle() for node in self.iter_inorder(lower)]
+        self._record_removed((obs.rect.left, obs.rect.top) for obs in removed)
+        return removed
 
-    def inorder(self):
-        """Return a list of nodes in inorder traversal."""
-        return self._inorder(self.tree.get_root())
+    def delete_range(self, x_min, x_max):
+        """
+        Remove every obstacle with x_min <= x1 <= x_max.
 
-    def _inorder(self, node):
-        if node is None:
+        Args:
+            x_min (int): Lower bound of the range (inclusive).
+            x_max (int): Upper bound of the range (inclusive).
+
+        Returns:
+            list[Obstacle]: The removed obstacles in (x1, y1) order.
+        """
+        lower, rest = self._split(self.tree.get_root(), x_min)
+        middle, upper = self._split(rest, x_max, inclusive=True)
+        root = self._join_trees(lower, upper)
+        self.tree.set_root(root)
+        if middle is None:
             return []
-        return self._inorder(node.get_left()) + [f"({node.get_x1()}, {node.get_y1()})"] + self._inorder(
-            node.get_right())
+        removed = [node.get_obstacle() for node in self.iter_inorder(middle)]
+        self._record_removed((obs.rect.left, obs.rect.top) for obs in removed)
+        return removed
+
+    def _split(self, node, x, inclusive=False):
+        """
+        Split a detached subtree into (nodes with x1 < x, the remaining nodes).
+        With inclusive=True nodes with x1 == x go to the first part.
+        Both returned subtrees are valid AVL trees with no parent. Only the
+        O(log n) nodes along the split path are re-linked (by _join).
+        """
+        if node is None:
+            return None, None
+        left, right = node.get_left(), node.get_right()
+        if left:
+            left.set_parent(None)
+        if right:
+            right.set_parent(None)
+        if node.get_x1() < x or (inclusive and node.get_x1() == x):
+            lower, upper = self._split(right, x, inclusive)
+            return self._join(left, node, lower), upper
+        lower, upper = self._split(left, x, inclusive)
+        return lower, self._join(upper, node, right)
+
+    def _join(self, left, pivot, right):
+        """
+        Join two detached subtrees around a pivot node, where every key in left
+        is lower than the pivot and every key in right is greater.
+        Descends the spine of the taller subtree and rebalances on the way up.
+        """
+        left_height, right_height = self._height(left), self._height(right)
+        if left_height > right_height + 1:
+            joined = self._join(left.get_right(), pivot, right)
+            left.set_right(joined)
+            joined.set_parent(left)
+            self._record_change()
+            self._update_height(left)
+            return self._rebalance(left)
+        if right_height > left_height + 1:
+            joined = self._join(left, pivot, right.get_left())
+            right.set_left(joined)
+            joined.set_parent(right)
+            self._record_change()
+            self._update_height(right)
+            return self._rebalance(right)
+        pivot.set_parent(None)
+        pivot.set_left(left)
+        pivot.set_right(right)
+        self._record_change()
+        if left:
+            left.set_parent(pivot)
+        if right:
+            right.set_parent(pivot)
+        self._update_height(pivot)
+        return pivot
+
+    def _join_trees(self, left, right):
+        """Join two detached subtrees (all keys in left lower) without a pivot."""
+        if right is None:
+            return left
+        right, minimum = self._remove_min(right)
+        if right:
+            right.set_parent(None)
+        return self._join(left, minimum, right)
+
+    def _remove_min(self, node):
+        """Detach the minimum node of a subtree; return (new subtree root, minimum)."""
+        if node.get_left() is None:
+            right = node.get_right()
+            if right:
+                right.set_parent(node.get_parent())
+            node.set_right(None)
+            return right, node
+        new_left, minimum = self._remove_min(node.get_left())
+        node.set_left(new_left)
+        if new_left:
+            new_left.set_parent(node)
+        self._record_change()
+        self._update_height(node)
+        return self._rebalance(node), minimum
+
+    def postorder(self):
+        """Return a list of nodes in postorder traversal."""
+        return [self._format_node(node) for node in self.iter_postorder()]
+
+    def inorder(self):
+        """Return a list of nodes in inorder traversal."""
+        return [self._format_node(node) for node in self.iter_inorder()]
 
     def preorder(self):
         """Return a list of nodes in preorder traversal."""
-        return self._preorder_recursive(self.tree.get_root())
+        return [self._format_node(node) for node in self.iter_preorder()]
 
-    def _preorder_recursive(self, node):
-        if node is None:
-            return []
-        return [f"({node.get_x1()}, {node.get_y1()})"] + self._preorder_recursive(
-            node.get_left()) + self._preorder_recursive(node.get_right())
+    def _format_node(self, node):
+        """Format a node key as "(x1, y1)" for printing and traversal animations."""
+        return f"({node.get_x1()}, {node.get_y1()})"
+
+    def iter_inorder(self, node=None):
+        """
+        Lazily yield the nodes of a subtree in inorder.
+
+        Uses an explicit stack (bounded by the tree height) instead of recursion.
+
+        Args:
+            node (AVLNode, optional): Subtree root. Defaults to the tree root.
+
+        Yields:
+            AVLNode: Nodes in ascending (x1, y1) order.
+        """
+        node = self.tree.get_root() if node is None else node
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.get_left()
+            node = stack.pop()
+            yield node
+            node = node.get_right()
+
+    def iter_preorder(self, node=None):
+        """
+        Lazily yield the nodes of a subtree in preorder.
+
+        Args:
+            node (AVLNode, optional): Subtree root. Defaults to the tree root.
+
+        Yields:
+            AVLNode: Each node before its left and right subtrees.
+        """
+        node = self.tree.get_root() if node is None else node
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.get_right():
+                stack.append(node.get_right())
+            if node.get_left():
+                stack.append(node.get_left())
+
+    def iter_postorder(self, node=None):
+        """
+        Lazily yield the nodes of a subtree in postorder.
+
+        Args:
+            node (AVLNode, optional): Subtree root. Defaults to the tree root.
+
+        Yields:
+            AVLNode: Each node after its left and right subtrees.
+        """
+        node = self.tree.get_root() if node is None else node
+        stack = []
+        last_visited = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.get_left()
+                continue
+            top = stack[-1]
+            if top.get_right() and last_visited is not top.get_right():
+                node = top.get_right()
+            else:
+                yield top
+                last_visited = stack.pop()
 
     def range_query(self, node, x_min, x_max, y_min, y_max, result=None):
-        """In-order traversal to collect nodes within a coordinate range."""
+        """
+        In-order traversal to collect nodes within a coordinate range.
+        Subtrees whose bounding box does not intersect the range are skipped.
+        """
         if result is None:
             result = []
 
         if not node:
             return result
 
+        # Prune subtrees that lie entirely outside the range
+        if (node.get_max_x() < x_min or node.get_min_x() > x_max or
+                node.get_max_y() < y_min or node.get_min_y() > y_max):
+            return result
+
         # Left subtree
         if node.get_left():
             self.range_query(node.get_left(), x_min, x_max, y_min, y_max, result)
@@ -258,6 +559,63 @@ class AVLTreeController:
 
         return result
 
+    def iter_range(self, x_min, x_max, y_min=float("-inf"), y_max=float("inf")):
+        """
+        Lazily yield the nodes whose (x1, y1) lies inside a coordinate range.
+
+        Nodes come out in (x1, y1) order; subtrees whose bounding box does not
+        intersect the range are never visited.
+
+        Args:
+            x_min (int): Lower x bound (inclusive).
+            x_max (int): Upper x bound (inclusive).
+            y_min (int, optional): Lower y bound (inclusive). Defaults to no bound.
+            y_max (int, optional): Upper y bound (inclusive). Defaults to no bound.
+
+        Yields:
+            AVLNode: Nodes inside the range.
+        """
+        for node in self._iter_box(x_min, x_max, y_min, y_max):
+            if x_min <= node.get_x1() <= x_max and y_min <= node.get_y1() <= y_max:
+                yield node
+
+    def iter_overlapping(self, x_min, x_max, y_min=float("-inf"), y_max=float("inf")):
+        """
+        Lazily yield the nodes whose obstacle rectangle (x1..x2, y1..y2)
+        overlaps a box, e.g. the broad phase of collision detection.
+
+        Args:
+            x_min (int): Left edge of the box (inclusive).
+            x_max (int): Right edge of the box (inclusive).
+            y_min (int, optional): Top edge of the box (inclusive). Defaults to no bound.
+            y_max (int, optional): Bottom edge of the box (inclusive). Defaults to no bound.
+
+        Yields:
+            AVLNode: Nodes whose obstacle overlaps the box, in (x1, y1) order.
+        """
+        for node in self._iter_box(x_min, x_max, y_min, y_max):
+            if (node.get_x1() <= x_max and node.get_x2() >= x_min and
+                    node.get_y1() <= y_max and node.get_y2() >= y_min):
+                yield node
+
+    def _iter_box(self, x_min, x_max, y_min, y_max):
+        """In-order walk that skips subtrees whose bounding box misses the given box."""
+        stack = []
+        node = self.tree.get_root()
+        while True:
+            while node is not None:
+                if (node.get_max_x() < x_min or node.get_min_x() > x_max or
+                        node.get_max_y() < y_min or node.get_min_y() > y_max):
+                    node = None
+                    break
+                stack.append(node)
+                node = node.get_left()
+            if not stack:
+                return
+            node = stack.pop()
+            yield node
+            node = node.get_right()
+
     def print_range_query(self, x_min, x_max, y_min, y_max):
         """Print nodes within the given range."""
         root = self.tree.get_root()
@@ -275,4 +633,59 @@ class AVLTreeController:
             try:
                 self.insert(obs)
             except Exception as e:
-                print(f"Error inserting obstacle: {e}")
\ No newline at end of file
+                print(f"Error inserting obstacle: {e}")
+
+    def bulk_load(self, obstacles_list):
+        """
+        Build a perfectly balanced AVL tree from a list of obstacles.
+
+        The input is sorted by its (x1, y1) key and duplicated keys are dropped
+        (the first occurrence wins, like repeated calls to insert). Records
+        that cannot be turned into an Obstacle are reported and dropped too,
+        like load_from_list does. The tree is then built bottom-up from the
+        sorted nodes in O(n), which replaces the current contents of the tree.
+
+        Args:
+            obstacles_list (list[dict]): Obstacle data, same format as insert.
+
+        Returns:
+            list[dict]: Obstacles that were skipped because their key already
+            existed or their data was invalid.
+        """
+        obstacles, skipped = [], []
+        for data in obstacles_list:
+            try:
+                obstacles.append((Obstacle(data), data))
+            except Exception as e:
+                print(f"Error inserting obstacle: {e}")
+                skipped.append(data)
+        # Stable sort: the first of several obstacles with the same key is kept
+        obstacles.sort(key=lambda item: (item[0].rect.left, item[0].rect.top))
+
+        unique, duplicates = [], []
+        for obstacle, data in obstacles:
+            if unique and unique[-1].rect.topleft == obstacle.rect.topleft:
+                duplicates.append(data)
+            else:
+                unique.append(obstacle)
+
+        nodes = [self.tree.create_node(obstacle) for obstacle in unique]
+        self.tree.set_root(self._build_balanced(nodes, 0, len(nodes) - 1, None))
+        self._snapshots.clear()  # Every node is new
+        self._record_change()
+
+        for data in duplicates:
+            print(f"⚠️ Obstacle at ({data['x1']}, {data['y1']}) already exists.")
+        return skipped + duplicates
+
+    def _build_balanced(self, nodes, low, high, parent):
+        """Recursive helper for bulk_load: link nodes[low..high] around their middle node."""
+        if low > high:
+            return None
+        mid = (low + high) // 2
+        node = nodes[mid]
+        node.set_parent(parent)
+        node.set_left(self._build_balanced(nodes, low, mid - 1, node))
+        node.set_right(self._build_balanced(nodes, mid + 1, high, node))
+        self._update_height(node)
+        return node
\ No newline at end of file
@@ -9,19 +9,22 @@ class ButtonController:
 
     def handle_pause_button(self, button, event):
         """
-        Check if the pause button was pressed and toggle the paused state.
+        Check if the pause button was pressed. The paused state is not
+        changed here: the press is applied with toggle_pause() at the next
+        simulation tick, so that it can be recorded and replayed.
 
         Args:
             button: The button object to handle.
             event: The pygame event to check.
 
         Returns:
-            True if the paused state was toggled, otherwise False.
+            True if the pause button was pressed, otherwise False.
         """
-        if button.handle_event(event):
-            self.paused = not self.paused
-            return True
-        return False
+        return button.handle_event(event)
+
+    def toggle_pause(self):
+        """Switch between paused and running."""
+        self.paused = not self.paused
 
     def is_paused(self):
         """Return whether the game is currently paused."""
@@ -1,5 +1,3 @@
-import pygame
-
 class CarController:
     """
     Controller for moving a Car object within vertical road limits.
@@ -16,7 +14,7 @@ class CarController:
             road_height: Optional height of the road area.
         """
         self.car = car_model
-        self.last_move_time = pygame.time.get_ticks()
+        self.move_elapsed = 0  # Simulated ms since the last forward move
         self.jumping_up = True
         self.jump_progress = 0
 
@@ -45,17 +43,20 @@ class CarController:
         self.car.set_y1(new_y1)
         self.car.set_y2(new_y2)
 
-    def move_forward(self):
+    def move_forward(self, dt_ms):
         """
         Move the car forward along the x-axis based on its speed and refresh time.
-        Ensures movement occurs only after the refresh interval.
+        Ensures movement occurs only after the refresh interval of simulated time.
+
+        Args:
+            dt_ms (float): Simulated time of the current tick in milliseconds.
         """
-        now = pygame.time.get_ticks()
-        if now - self.last_move_time >= self.car.get_refresh_time():
+        self.move_elapsed += dt_ms
+        if self.move_elapsed >= self.car.get_refresh_time():
             dx = self.car.get_speed_x()
             self.car.set_x1(self.car.get_x1() + dx)
             self.car.set_x2(self.car.get_x2() + dx)
-            self.last_move_time = now
+            self.move_elapsed -= self.car.get_refresh_time()
 
     def jump(self):
         """
@@ -0,0 +1,291 @@
+import struct
+import pygame
+
+
+class TickInput:
+    """
+    Player input for one simulation tick.
+
+    Attributes:
+        up (bool): Move the car up.
+        down (bool): Move the car down.
+        jump (bool): Start a jump.
+        pause (bool): Toggle the pause at the start of the tick.
+        clicks (tuple[tuple[int, int], ...]): Screen positions clicked on the tree panel.
+    """
+
+    __slots__ = ("up", "down", "jump", "pause", "clicks")
+
+    # Bits of the flags byte in a recording
+    UP, DOWN, JUMP, PAUSE, CLICKS = 1, 2, 4, 8, 16
+    CLICK = struct.Struct("<HH")
+
+    def __init__(self, up=False, down=False, jump=False, pause=False, clicks=()):
+        """
+        Initialize the input of a tick.
+
+        Args:
+            up (bool, optional): Move up. Defaults to False.
+            down (bool, optional): Move down. Defaults to False.
+            jump (bool, optional): Jump. Defaults to False.
+            pause (bool, optional): Toggle the pause. Defaults to False.
+            clicks (tuple, optional): Tree panel clicks (x, y). Defaults to none.
+        """
+        self.up = up
+        self.down = down
+        self.jump = jump
+        self.pause = pause
+        self.clicks = tuple(clicks)
+
+    def to_bytes(self):
+        """
+        Encode the input as one flags byte, followed by the clicks if any:
+        a count byte and two little-endian uint16 per click.
+
+        Returns:
+            bytes: Encoded input (a single byte for most ticks).
+        """
+        flags = ((self.UP if self.up else 0) | (self.DOWN if self.down else 0)
+                 | (self.JUMP if self.jump else 0) | (self.PAUSE if self.pause else 0))
+        if not self.clicks:
+            return bytes((flags,))
+        clicks = self.clicks[:255]
+        return (bytes((flags | self.CLICKS, len(clicks)))
+                + b"".join(self.CLICK.pack(x, y) for x, y in clicks))
+
+    @classmethod
+    def from_stream(cls, stream):
+        """
+        Decode the next input written by to_bytes.
+
+        Args:
+            stream (io.BufferedReader): Binary stream positioned at an input.
+
+        Returns:
+            TickInput | None: The decoded input, or None at the end of the stream.
+        """
+        data = stream.read(1)
+        if not data:
+            return None
+        flags = data[0]
+        if flags == 0:
+            return NO_INPUT
+        clicks = ()
+        if flags & cls.CLICKS:
+            count = stream.read(1)[0]
+            raw = stream.read(count * cls.CLICK.size)
+            clicks = tuple(cls.CLICK.unpack_from(raw, i * cls.CLICK.size) for i in range(count))
+        return cls(bool(flags & cls.UP), bool(flags & cls.DOWN), bool(flags & cls.JUMP),
+                   bool(flags & cls.PAUSE), clicks)
+
+    def __eq__(self, other):
+        return (isinstance(other, TickInput)
+                and (self.up, self.down, self.jump, self.pause, self.clicks)
+                == (other.up, other.down, other.jump, other.pause, other.clicks))
+
+    def __repr__(self):
+        return (f"TickInput(up={self.up}, down={self.down}, jump={self.jump}, "
+                f"pause={self.pause}, clicks={self.clicks})")
+
+
+NO_INPUT = TickInput()
+
+
+class InputSource:
+    """
+    Base class of the per-tick input sources.
+
+    Pause button presses and tree panel clicks arrive as events between
+    ticks and are pushed to the source by the game loop. Sources that decide
+    the input themselves (scripts, recordings) ignore them, which is the
+    default here.
+    """
+
+    def push_pause(self):
+        """Ignore live pause presses."""
+
+    def push_click(self, pos):
+        """Ignore live tree panel clicks."""
+
+    def read(self, tick):
+        """
+        Return the input for a tick.
+
+        Args:
+            tick (int): Index of the tick being simulated.
+
+        Returns:
+            TickInput: Input to apply during the tick.
+        """
+        raise NotImplementedError
+
+
+class KeyboardInput(InputSource):
+    """
+    Reads the live keyboard state (arrows to move, space to jump).
+
+    Pause button presses and tree panel clicks arrive as events between
+    ticks; the game loop pushes them here and they are handed out with the
+    input of the next tick.
+    """
+
+    def __init__(self):
+        """Initialize the input with no pending events."""
+        self._pause = False
+        self._clicks = []
+
+    def push_pause(self):
+        """Toggle the pause at the next tick (two presses cancel out)."""
+        self._pause = not self._pause
+
+    def push_click(self, pos):
+        """Apply a tree panel click at the next tick."""
+        self._clicks.append(pos)
+
+    def read(self, tick):
+        """
+        Return the input for a tick.
+
+        Args:
+            tick (int): Index of the tick being simulated.
+
+        Returns:
+            TickInput: Keys currently held down, plus the events pushed since the last tick.
+        """
+        keys = pygame.key.get_pressed()
+        tick_input = TickInput(keys[pygame.K_UP], keys[pygame.K_DOWN], keys[pygame.K_SPACE],
+                               self._pause, self._clicks)
+        self._pause = False
+        self._clicks = []
+        return tick_input
+
+
+class NullInput(InputSource):
+    """Input source that never presses anything (the car keeps its lane)."""
+
+    def read(self, tick):
+        """Return an empty input for every tick."""
+        return NO_INPUT
+
+
+class ScriptedInput(InputSource):
+    """
+    Input source that plays a fixed list of inputs, one per tick.
+    Live pause presses and clicks are ignored: the script decides.
+
+    Attributes:
+        script (list[TickInput]): Input of tick i at index i.
+        loop (bool): Start over at the end of the script instead of stopping input.
+    """
+
+    def __init__(self, script, loop=False):
+        """
+        Initialize the scripted input.
+
+        Args:
+            script (Iterable[TickInput]): Inputs, one per tick.
+            loop (bool, optional): Repeat the script. Defaults to False.
+        """
+        self.script = list(script)
+        self.loop = loop
+
+    def read(self, tick):
+        """Return the scripted input for a tick (empty after the end, unless looping)."""
+        if self.loop and self.script:
+            return self.script[tick % len(self.script)]
+        return self.script[tick] if tick < len(self.script) else NO_INPUT
+
+
+class InputRecorder(InputSource):
+    """
+    Input source that passes another source through and writes every tick's
+    input to a binary file, to be replayed with ReplayInput.
+
+    File layout: the MAGIC bytes, a format version byte and the tick rate
+    (little-endian uint16), then one TickInput.to_bytes() record per tick.
+
+    Attributes:
+        MAGIC (bytes): File signature.
+        VERSION (int): Format version.
+        source (InputSource): Wrapped input source.
+        path (str): Recording file.
+    """
+
+    MAGIC = b"CGIR"
+    VERSION = 1
+    HEADER = struct.Struct("<4sBH")
+
+    def __init__(self, source, path, tick_rate=60):
+        """
+        Initialize the recorder and write the file header.
+
+        Args:
+            source (InputSource): Input source to record (e.g., KeyboardInput).
+            path (str): Recording file, overwritten.
+            tick_rate (int, optional): Ticks per second of the session. Defaults to 60.
+        """
+        self.source = source
+        self.path = path
+        self._file = open(path, "wb")
+        self._file.write(self.HEADER.pack(self.MAGIC, self.VERSION, tick_rate))
+
+    def push_pause(self):
+        """Forward a live pause press to the recorded source."""
+        self.source.push_pause()
+
+    def push_click(self, pos):
+        """Forward a live tree panel click to the recorded source."""
+        self.source.push_click(pos)
+
+    def read(self, tick):
+        """Return the source's input for a tick, after writing it to the file."""
+        tick_input = self.source.read(tick)
+        self._file.write(tick_input.to_bytes())
+        return tick_input
+
+    def close(self):
+        """Flush and close the recording file."""
+        self._file.close()
+
+
+class ReplayInput(InputSource):
+    """
+    Input source that plays back a file written by InputRecorder.
+    Live pause presses and clicks are ignored: the recording decides.
+
+    Attributes:
+        path (str): Recording file.
+        tick_rate (int): Ticks per second of the recorded session.
+        inputs (list[TickInput]): Input of tick i at index i.
+    """
+
+    def __init__(self, path):
+        """
+        Load a recording.
+
+        Args:
+            path (str): Recording file.
+
+        Raises:
+            ValueError: If the file is not a recording in a supported format.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            header = file.read(InputRecorder.HEADER.size)
+            if len(header) < InputRecorder.HEADER.size:
+                raise ValueError(f"{path} is not an input recording")
+            magic, version, self.tick_rate = InputRecorder.HEADER.unpack(header)
+            if magic != InputRecorder.MAGIC or version != InputRecorder.VERSION:
+                raise ValueError(f"{path} is not a version {InputRecorder.VERSION} input recording")
+            self.inputs = []
+            tick_input = TickInput.from_stream(file)
+            while tick_input is not None:
+                self.inputs.append(tick_input)
+                tick_input = TickInput.from_stream(file)
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def read(self, tick):
+        """Return the recorded input of a tick (empty after the end of the recording)."""
+        return self.inputs[tick] if tick < len(self.inputs) else NO_INPUT
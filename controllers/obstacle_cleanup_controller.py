@@ -13,25 +13,36 @@ class ObstacleCleanupController:
         """
         self.avl_controller = avl_controller
 
-    def cleanup_obstacles(self, obstacles_list, screen_width):
+    def cleanup_obstacles(self, obstacles_list, camera_x):
         """
         Remove obstacles that have moved off-screen and delete them from the AVL tree.
 
+        Obstacles are evicted with a single split of the AVL tree per frame,
+        instead of one delete per obstacle. The split keeps every key from
+        the smallest x1 of the obstacles still on screen: obstacles are up to
+        70 px wide, so an obstacle with a lower x1 than an off-screen one can
+        still be visible, and must stay in the tree and the active list.
+
         Args:
-            obstacles_list: List of active Obstacle instances.
-            screen_width: Width of the game screen (unused here but can help future checks).
+            obstacles_list: List of active Obstacle instances (updated in place).
+            camera_x: World x of the left edge of the screen.
 
         Returns:
             List of removed obstacles.
         """
-        removed = []
-
-        for obs in obstacles_list[:]:
-            if obs.rect.right < 0:  # Off-screen
-                # Delete from AVL using initial coordinates
-                self.avl_controller.delete(obs.init_x1, obs.init_y1)
-
-                removed.append(obs)
-                obstacles_list.remove(obs)
-
-        return removed
\ No newline at end of file
+        off_screen = [obs.rect.left for obs in obstacles_list if obs.rect.right < camera_x]
+        if not off_screen:
+            return []
+
+        # Evict everything behind the camera, up to the first visible obstacle, in one call
+        threshold = max(off_screen) + 1
+        visible = [obs.rect.left for obs in obstacles_list if obs.rect.right >= camera_x]
+        if visible:
+            threshold = min(threshold, min(visible))
+        removed = [obs for obs in obstacles_list if obs.rect.left < threshold]
+        if not removed:
+            return []
+        self.avl_controller.split_before(threshold)
+
+        obstacles_list[:] = [obs for obs in obstacles_list if obs.rect.left >= threshold]
+        return removed
@@ -0,0 +1,157 @@
+import random
+
+
+class ObstacleGenerator:
+    """
+    Seeded procedural generator of obstacles, produced lazily in chunks.
+
+    The road is cut into chunks of chunk_width pixels. Chunk i is generated
+    from its own random stream, seeded from (seed, i), so a level is fully
+    determined by the seed whatever order or moment the chunks are built in.
+    Chunks are inserted into the AVL tree just ahead of the camera; the
+    generator keeps no reference to them, so once the cleanup evicts the
+    obstacles behind the camera they are gone and memory stays proportional
+    to the visible window, however long the road.
+
+    Within a chunk, obstacles sit in lanes: each lane keeps min_gap pixels
+    between consecutive obstacles and at least free_lanes lanes are left
+    clear at every x. Chunks end with a min_gap margin, so the rules also
+    hold across chunk boundaries.
+
+    Attributes:
+        seed (int): Level seed.
+        chunk_width (int): Width of a chunk in world pixels.
+        density (float): Obstacles attempted per 1000 world pixels.
+        type_mix (dict[str, float]): Relative weight of every obstacle type.
+        lanes (int): Number of lanes across the road.
+        free_lanes (int): Lanes kept clear at every x.
+        min_gap (int): Minimum x distance between obstacles of the same lane.
+        road_top (int): World y of the top of the first lane.
+        road_bottom (int): World y of the bottom of the last lane.
+        start_x (int): World x of the first chunk.
+        length (int | None): World x where generation stops, None for no end.
+        next_chunk (int): Index of the next chunk to generate.
+    """
+
+    MIN_SIZE = (50, 40)  # Smallest obstacle (width, height)
+    MAX_SIZE = (70, 60)  # Largest obstacle (width, height)
+
+    def __init__(self, seed=0, chunk_width=2000, density=5, type_mix=None, lanes=5, free_lanes=1,
+                 min_gap=150, road_top=0, road_bottom=800, start_x=200, length=None):
+        """
+        Initialize the generator.
+
+        Args:
+            seed (int, optional): Level seed. Defaults to 0.
+            chunk_width (int, optional): Chunk width in world pixels. Defaults to 2000.
+            density (float, optional): Obstacles per 1000 px. Defaults to 5.
+            type_mix (dict, optional): Weight per type name. Defaults to equal rocks, cones and oil.
+            lanes (int, optional): Number of lanes. Defaults to 5.
+            free_lanes (int, optional): Lanes kept clear at every x. Defaults to 1.
+            min_gap (int, optional): Same-lane spacing in pixels. Defaults to 150.
+            road_top (int, optional): Top of the road. Defaults to 0.
+            road_bottom (int, optional): Bottom of the road. Defaults to 800.
+            start_x (int, optional): Where the first chunk starts (a clear run-up). Defaults to 200.
+            length (int, optional): Where generation stops. Defaults to no end.
+
+        Raises:
+            ValueError: If the lanes are too narrow for an obstacle or leave no lane to fill.
+        """
+        if lanes <= free_lanes or (road_bottom - road_top) // lanes < self.MAX_SIZE[1]:
+            raise ValueError("Lanes must leave room for obstacles and for the free lanes.")
+        self.seed = seed
+        self.chunk_width = chunk_width
+        self.density = density
+        self.type_mix = type_mix or {"rock": 1, "cone": 1, "oil": 1}
+        self.lanes = lanes
+        self.free_lanes = free_lanes
+        self.min_gap = min_gap
+        self.road_top = road_top
+        self.road_bottom = road_bottom
+        self.start_x = start_x
+        self.length = length
+        self.next_chunk = 0
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build a generator from the game configuration, or return None if the
+        "generator" section is missing or disabled.
+
+        Args:
+            config (dict): Game configuration; the level ends at its road_length.
+
+        Returns:
+            ObstacleGenerator | None: The configured generator.
+        """
+        settings = dict(config.get("generator") or {})
+        if not settings.pop("enabled", False):
+            return None
+        return cls(length=config.get("road_length"), **settings)
+
+    def chunk_start(self, index):
+        """Return the world x where chunk index starts."""
+        return self.start_x + index * self.chunk_width
+
+    def generate_chunk(self, index):
+        """
+        Generate the obstacles of one chunk, in x order.
+
+        Args:
+            index (int): Chunk index (0 is the first chunk of the road).
+
+        Returns:
+            list[dict]: Obstacle data in the same format as config/obstacles.json.
+        """
+        rng = random.Random(f"{self.seed}:{index}")
+        start = self.chunk_start(index)
+        end = start + self.chunk_width
+        if self.length is not None:
+            end = min(end, self.length)
+        types, weights = list(self.type_mix), list(self.type_mix.values())
+        lane_height = (self.road_bottom - self.road_top) // self.lanes
+
+        attempts = round(self.density * self.chunk_width / 1000)
+        positions = sorted(rng.randrange(start, max(end, start + 1)) for _ in range(attempts))
+        lane_end = [float("-inf")] * self.lanes  # x2 of the last obstacle of every lane
+        obstacles = []
+        for x1 in positions:
+            width = rng.randint(self.MIN_SIZE[0], self.MAX_SIZE[0])
+            height = rng.randint(self.MIN_SIZE[1], self.MAX_SIZE[1])
+            lane = rng.randrange(self.lanes)
+            kind = rng.choices(types, weights)[0]
+            offset = rng.randint(0, lane_height - height)
+
+            # Keep the chunk margin, the lane gap and the free lanes
+            if x1 + width + self.min_gap > end or lane_end[lane] + self.min_gap > x1:
+                continue
+            blocked = sum(1 for x2 in lane_end if x2 + self.min_gap > x1)
+            if blocked + 1 > self.lanes - self.free_lanes:
+                continue
+
+            y1 = self.road_top + lane * lane_height + offset
+            obstacles.append({"type": kind, "x1": x1, "y1": y1, "x2": x1 + width, "y2": y1 + height})
+            lane_end[lane] = x1 + width
+        return obstacles
+
+    def fill(self, avl_controller, until_x):
+        """
+        Generate and insert every chunk starting at or before until_x that
+        was not generated yet.
+
+        Args:
+            avl_controller (AVLTreeController): Tree receiving the obstacles.
+            until_x (float): World x that must be covered.
+
+        Returns:
+            int: Number of obstacles inserted.
+        """
+        inserted = 0
+        while self.chunk_start(self.next_chunk) <= until_x:
+            if self.length is not None and self.chunk_start(self.next_chunk) >= self.length:
+                break
+            for data in self.generate_chunk(self.next_chunk):
+                avl_controller.insert(data)
+                inserted += 1
+            self.next_chunk += 1
+        return inserted
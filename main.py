@@ -1,11 +1,86 @@
+import argparse
+import os
 import pygame
 from controllers.avl_tree_controller import AVLTreeController
-from models.avl_tree import AVLTree
+from controllers.input_source import InputRecorder, KeyboardInput, NullInput, ReplayInput
+from models.avl_tree import AVLTree, CompactAVLNode
 from utils.file_admin import read_json
 from views.menu_view import MenuView
 from views.game_coordinator import GameCoordinator
 
-if __name__ == "__main__":
+
+def load_level(config_path="config/settings.json", obstacles_path="config/obstacles.json"):
+    """
+    Load the game configuration and build the AVL tree of the level's obstacles.
+    With the procedural generator enabled the tree starts empty and the game
+    view fills it as the road scrolls.
+
+    Returns:
+        tuple[dict, AVLTreeController]: The configuration and the tree controller.
+    """
+    # Create the AVL tree and its controller
+    tree = AVLTree(node_class=CompactAVLNode)
+    controller = AVLTreeController(tree)
+
+    # Load game configuration from JSON
+    config = read_json(config_path)["config"]
+    if (config.get("generator") or {}).get("enabled"):
+        seed = config["generator"].get("seed", 0)
+        print(f"Obstacles generated on the fly (seed {seed}).")
+        return config, controller
+
+    # Load obstacles from JSON and build the tree in a single pass
+    obs_data = read_json(obstacles_path)
+    try:
+        skipped = controller.bulk_load(obs_data["obstacles"])
+        print(f"Obstacles loaded successfully ({len(skipped)} duplicate or invalid records skipped).")
+    except Exception as e:
+        print(f"[ERROR] Could not load obstacles: {e}")
+    return config, controller
+
+
+def run_headless(runs=1, max_ticks=None, replay=None):
+    """
+    Simulate whole games without a display, as fast as possible, and print
+    one result summary per run. The player input comes from a recording,
+    or is empty.
+
+    Args:
+        runs (int, optional): Number of games to simulate. Defaults to 1.
+        max_ticks (int, optional): Tick limit per game. Defaults to no limit,
+            or the length of the recording when replaying.
+        replay (str, optional): Input recording to play back. Defaults to none.
+
+    Returns:
+        list[dict]: The summary of every run (see GameCoordinator.run_headless).
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    input_source = NullInput()
+    if replay:
+        input_source = ReplayInput(replay)
+        if max_ticks is None:
+            max_ticks = len(input_source)
+    results = []
+    for i in range(runs):
+        config, controller = load_level()
+        coordinator = GameCoordinator(config, controller, input_source=input_source, headless=True)
+        result = coordinator.run_headless(max_ticks)
+        print(f"Run {i + 1}: {result}")
+        results.append(result)
+    pygame.quit()
+    return results
+
+
+def run_game(record=None, replay=None):
+    """
+    Show the menu and play the game in a window, optionally recording the
+    player's input or replaying a recording in real time.
+
+    Args:
+        record (str, optional): File to record the input of the session to.
+        replay (str, optional): Input recording to play back instead of the keyboard.
+    """
     pygame.init()
 
     # 1. Display the main menu
@@ -13,24 +88,42 @@ if __name__ == "__main__":
     start_game = menu.run()  # Wait until the player selects "PLAY" or closes the window
 
     if start_game:
-        # 2. Create the AVL tree and its controller
-        tree = AVLTree()
-        controller = AVLTreeController(tree)
+        # 2. Load the configuration and the obstacles
+        config, controller = load_level()
 
-        # 3. Load game configuration from JSON
-        data = read_json("config/settings.json")
-        config = data["config"]
+        # 3. Choose where the input of every tick comes from
+        input_source, max_ticks = None, None
+        if replay:
+            input_source = ReplayInput(replay)
+            config["tick_rate"] = input_source.tick_rate
+            max_ticks = len(input_source)
+        elif record:
+            input_source = InputRecorder(KeyboardInput(), record, config.get("tick_rate", 60))
 
-        # 4. Load obstacles from JSON and insert them into the tree
-        obs_data = read_json("config/obstacles.json")
+        # 4. Create the game coordinator and run the game
+        coordinator = GameCoordinator(config, controller, input_source=input_source)
         try:
-            controller.load_from_list(obs_data["obstacles"])
-            print("Obstacles loaded successfully.")
-        except Exception as e:
-            print(f"[ERROR] Could not load obstacles: {e}")
+            coordinator.run(max_ticks)
+        finally:
+            if record and not replay:
+                input_source.close()
+                print(f"Input recorded to {record} ({coordinator.ticks} ticks)")
+
+    pygame.quit()
 
-        # 5. Create the game coordinator and run the game
-        coordinator = GameCoordinator(config, controller)
-        coordinator.run()
 
-    pygame.quit()
\ No newline at end of file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Car game with an AVL tree of obstacles.")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulate without a window, as fast as possible")
+    parser.add_argument("--ticks", type=int, default=None, help="tick limit per headless run")
+    parser.add_argument("--runs", type=int, default=1, help="number of headless runs")
+    parser.add_argument("--record", metavar="FILE", help="record the input of the session to FILE")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="play back the input recorded in FILE (at max speed with --headless)")
+    args = parser.parse_args()
+
+    if args.headless:
+        run_headless(args.runs, args.ticks, args.replay)
+    else:
+        run_game(args.record, args.replay)
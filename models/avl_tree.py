@@ -11,12 +11,15 @@ class AVLNode:
         _height (int): Height of this node in the AVL tree.
         _left (AVLNode | None): Left child node.
         _right (AVLNode | None): Right child node.
+        _min_x, _max_x, _min_y, _max_y (int): Bounding box of every obstacle
+            in the subtree rooted at this node (used to prune range queries).
 
     Note:
         This class provides standard getters and setters for:
         - Coordinates (x1, y1, x2, y2)
         - Obstacle object
         - Height
+        - Subtree bounding box
         - Parent, left, and right children
     """
 
@@ -33,6 +36,10 @@ class AVLNode:
         self._height = 1
         self._left = None
         self._right = None
+        self._min_x = self.get_x1()
+        self._max_x = self.get_x2()
+        self._min_y = self.get_y1()
+        self._max_y = self.get_y2()
 
     # --- General Getters ---
     def get_x1(self): return self._obstacle.rect.left
@@ -44,6 +51,10 @@ class AVLNode:
     def get_left(self): return self._left
     def get_right(self): return self._right
     def get_parent(self): return self.parent
+    def get_min_x(self): return self._min_x
+    def get_max_x(self): return self._max_x
+    def get_min_y(self): return self._min_y
+    def get_max_y(self): return self._max_y
 
     # --- General Setters ---
     def set_height(self, value): self._height = value
@@ -51,6 +62,13 @@ class AVLNode:
     def set_right(self, node): self._right = node
     def set_parent(self, node): self.parent = node
 
+    def set_bounds(self, min_x, max_x, min_y, max_y):
+        """Set the bounding box of the subtree rooted at this node."""
+        self._min_x = min_x
+        self._max_x = max_x
+        self._min_y = min_y
+        self._max_y = max_y
+
     def to_dict(self):
         """
         Convert the node data into a dictionary.
@@ -75,17 +93,130 @@ class AVLNode:
         return cls(obstacle)
 
 
+class CompactAVLNode:
+    """
+    Memory-compact AVL node with the same API as AVLNode.
+
+    Uses __slots__ instead of a per-instance __dict__ and caches the obstacle
+    world coordinates of the obstacle as plain integers when the node is
+    created, so key comparisons do not go through the obstacle's rect.
+
+    Attributes:
+        _obstacle (Obstacle): The obstacle stored in this node.
+        parent (CompactAVLNode | None): Reference to the parent node.
+        _height (int): Height of this node in the AVL tree.
+        _left (CompactAVLNode | None): Left child node.
+        _right (CompactAVLNode | None): Right child node.
+        _x1, _y1, _x2, _y2 (int): Cached obstacle coordinates.
+        _min_x, _max_x, _min_y, _max_y (int): Bounding box of the subtree.
+    """
+
+    __slots__ = ("_obstacle", "parent", "_height", "_left", "_right",
+                 "_x1", "_y1", "_x2", "_y2",
+                 "_min_x", "_max_x", "_min_y", "_max_y")
+
+    def __init__(self, obstacle: Obstacle, parent=None):
+        """
+        Initialize a new compact AVL tree node.
+
+        Args:
+            obstacle (Obstacle): The obstacle stored in this node.
+            parent (CompactAVLNode, optional): Reference to the parent node. Defaults to None.
+        """
+        rect = obstacle.rect
+        self._obstacle = obstacle
+        self.parent = parent
+        self._height = 1
+        self._left = None
+        self._right = None
+        self._x1, self._y1 = rect.left, rect.top
+        self._x2, self._y2 = rect.right, rect.bottom
+        self._min_x, self._max_x = self._x1, self._x2
+        self._min_y, self._max_y = self._y1, self._y2
+
+    # --- General Getters ---
+    def get_x1(self): return self._x1
+    def get_y1(self): return self._y1
+    def get_x2(self): return self._x2
+    def get_y2(self): return self._y2
+    def get_obstacle(self): return self._obstacle
+    def get_height(self): return self._height
+    def get_left(self): return self._left
+    def get_right(self): return self._right
+    def get_parent(self): return self.parent
+    def get_min_x(self): return self._min_x
+    def get_max_x(self): return self._max_x
+    def get_min_y(self): return self._min_y
+    def get_max_y(self): return self._max_y
+
+    # --- General Setters ---
+    def set_height(self, value): self._height = value
+    def set_left(self, node): self._left = node
+    def set_right(self, node): self._right = node
+    def set_parent(self, node): self.parent = node
+
+    def set_bounds(self, min_x, max_x, min_y, max_y):
+        """Set the bounding box of the subtree rooted at this node."""
+        self._min_x = min_x
+        self._max_x = max_x
+        self._min_y = min_y
+        self._max_y = max_y
+
+    def to_dict(self):
+        """
+        Convert the node data into a dictionary.
+
+        Returns:
+            dict: Dictionary representation of the obstacle (coordinates and type).
+        """
+        return self._obstacle.to_dict()
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Create a node from a dictionary (e.g., JSON data).
+
+        Args:
+            data (dict): Dictionary containing obstacle data.
+
+        Returns:
+            CompactAVLNode: New node containing the obstacle.
+        """
+        return cls(Obstacle(data))
+
+
 class AVLTree:
     """
     AVL tree structure for storing obstacles.
 
     Attributes:
         _root (AVLNode | None): Root node of the tree.
+        _node_class (type): Node type created for new obstacles
+            (AVLNode or CompactAVLNode).
     """
 
-    def __init__(self):
-        """Initialize an empty AVL tree."""
+    def __init__(self, node_class=AVLNode):
+        """
+        Initialize an empty AVL tree.
+
+        Args:
+            node_class (type, optional): Node type used to store obstacles.
+                Defaults to AVLNode.
+        """
         self._root = None
+        self._node_class = node_class
 
     def get_root(self): return self._root
-    def set_root(self, node): self._root = node
\ No newline at end of file
+    def set_root(self, node): self._root = node
+
+    def create_node(self, obstacle: Obstacle):
+        """
+        Create a detached node of this tree's node type.
+
+        Args:
+            obstacle (Obstacle): The obstacle stored in the node.
+
+        Returns:
+            AVLNode | CompactAVLNode: The new node.
+        """
+        return self._node_class(obstacle)
\ No newline at end of file
@@ -1,19 +1,31 @@
 import pygame
+from models.obstacle_type import get_obstacle_type
+from utils.sprite_cache import load_sprite
 
 class Obstacle:
     """
     Represents an obstacle on the road.
 
+    Obstacles are lightweight records: building one does not need an
+    initialised display, so they can be stored in the AVL tree and used by
+    tooling without a window. The sprite is only loaded the first time the
+    obstacle is drawn, from a cache shared by every obstacle of the same
+    sprite and size. Per-type data (damage, default sprite) lives in a shared
+    ObstacleType.
+
     Attributes:
         type (str): Type of obstacle (e.g., cone, rock, oil, hole, barrera).
         hit (bool): Flag indicating whether the obstacle has been hit.
-        init_x1 (int): Initial fixed x-coordinate (used for AVL tree).
-        init_y1 (int): Initial fixed y-coordinate (used for AVL tree).
-        damage (int): Amount of damage caused by this obstacle.
-        rect (pygame.Rect): Rectangle representing position and size for collisions.
-        image (pygame.Surface): Loaded and scaled sprite image of the obstacle.
+        kind (ObstacleType): Shared type data for this obstacle.
+        damage (int): Amount of damage caused by this obstacle (from its type).
+        rect (pygame.Rect): Position and size in world coordinates, used for
+            collisions and as the AVL tree key. It never moves while scrolling.
+        sprite (str | None): Path to the obstacle image.
+        image (pygame.Surface): Scaled sprite image, loaded on first access.
     """
 
+    __slots__ = ("type", "hit", "kind", "rect", "sprite", "_image")
+
     def __init__(self, data: dict):
         """
         Initialize an obstacle from data.
@@ -23,50 +35,53 @@ class Obstacle:
                 Required keys:
                     - "type" (str): Obstacle type.
                     - "x1", "y1", "x2", "y2" (int): Coordinates of the obstacle.
-                    - "sprite" (str): Path to the obstacle image.
+                Optional keys:
+                    - "sprite" (str): Path to the obstacle image
+                      (defaults to the sprite of its type).
         """
         self.type = data["type"]
         self.hit = False
 
-        # Fixed coordinates for AVL usage
-        self.init_x1 = data["x1"]
-        self.init_y1 = data["y1"]
-
-        # Damage based on type
-        damage_map = {
-            "cone": 20,
-            "rock": 15,
-            "oil": 10,
-            "hole": 20,
-            "barrera": 12
-        }
-        self.damage = damage_map.get(self.type, 10)
-
-        # Create collision rectangle
+        # Shared per-type data (damage, default sprite)
+        self.kind = get_obstacle_type(self.type)
+
+        # Create collision rectangle (world coordinates)
         x1, y1, x2, y2 = data["x1"], data["y1"], data["x2"], data["y2"]
         self.rect = pygame.Rect(x1, y1, x2 - x1, y2 - y1)
 
-        # Load and scale image
-        self.image = pygame.image.load(data["sprite"]).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.rect.width, self.rect.height))
+        # Sprite is loaded lazily, only when the obstacle is drawn
+        self.sprite = data.get("sprite") or self.kind.sprite
+        self._image = None
+
+    @property
+    def damage(self):
+        """Amount of damage caused by this obstacle."""
+        return self.kind.damage
 
-    def update(self, dx: int):
+    @property
+    def image(self):
         """
-        Move the obstacle along the X-axis (road scrolling).
+        Scaled sprite image of the obstacle, loaded on first access.
 
-        Args:
-            dx (int): Amount to shift left (positive values scroll left).
+        Note:
+            Requires an initialised display (convert_alpha).
+
+        Returns:
+            pygame.Surface: The shared sprite scaled to the obstacle's size.
         """
-        self.rect.x -= dx
+        if self._image is None:
+            self._image = load_sprite(self.sprite, self.rect.width, self.rect.height)
+        return self._image
 
-    def draw(self, screen):
+    def draw(self, screen, camera_x=0):
         """
         Render the obstacle on the screen.
 
         Args:
             screen (pygame.Surface): The game screen surface.
+            camera_x (int, optional): World x of the left edge of the screen. Defaults to 0.
         """
-        screen.blit(self.image, self.rect)
+        screen.blit(self.image, (self.rect.x - camera_x, self.rect.y))
 
     def to_dict(self):
         """
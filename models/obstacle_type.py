@@ -0,0 +1,109 @@
+from utils.file_admin import read_json
+
+OBSTACLE_TYPES_FILE = "config/obstacle_types.json"
+
+
+class ObstacleType:
+    """
+    Shared description of one kind of obstacle (flyweight).
+
+    A single instance per type name is shared by every Obstacle of that
+    type, so per-type data is stored once instead of once per obstacle.
+
+    Attributes:
+        name (str): Type name (e.g., cone, rock, oil).
+        damage (int): Damage caused when the car hits the obstacle.
+        sprite (str | None): Default sprite path for this type.
+    """
+
+    __slots__ = ("name", "damage", "sprite")
+
+    def __init__(self, name: str, damage: int, sprite=None):
+        """
+        Initialize an obstacle type.
+
+        Args:
+            name (str): Type name.
+            damage (int): Damage caused by obstacles of this type.
+            sprite (str, optional): Default sprite path. Defaults to None.
+        """
+        self.name = name
+        self.damage = damage
+        self.sprite = sprite
+
+
+class ObstacleTypeRegistry:
+    """
+    Data-driven registry of obstacle types, loaded from a JSON file.
+
+    Attributes:
+        default_damage (int): Damage used for types missing from the file.
+        _types (dict[str, ObstacleType]): Registered types by name.
+    """
+
+    def __init__(self, default_damage=10):
+        """
+        Initialize an empty registry.
+
+        Args:
+            default_damage (int, optional): Damage for unknown types. Defaults to 10.
+        """
+        self.default_damage = default_damage
+        self._types = {}
+
+    def register(self, name: str, damage: int, sprite=None):
+        """
+        Register (or replace) an obstacle type.
+
+        Returns:
+            ObstacleType: The registered type.
+        """
+        obstacle_type = ObstacleType(name, damage, sprite)
+        self._types[name] = obstacle_type
+        return obstacle_type
+
+    def get(self, name: str):
+        """
+        Return the shared type for name, registering a default one if unknown.
+
+        Args:
+            name (str): Type name.
+
+        Returns:
+            ObstacleType: The shared obstacle type.
+        """
+        obstacle_type = self._types.get(name)
+        if obstacle_type is None:
+            obstacle_type = self.register(name, self.default_damage)
+        return obstacle_type
+
+    @classmethod
+    def from_file(cls, path: str = OBSTACLE_TYPES_FILE):
+        """
+        Build a registry from a JSON file.
+
+        Args:
+            path (str, optional): Path to the types file.
+
+        Returns:
+            ObstacleTypeRegistry: Registry with every type in the file.
+        """
+        data = read_json(path)
+        registry = cls(data.get("default_damage", 10))
+        for name, info in data["types"].items():
+            registry.register(name, info["damage"], info.get("sprite"))
+        return registry
+
+
+_registry = None
+
+
+def get_obstacle_type(name: str):
+    """
+    Return the shared ObstacleType for a type name.
+    The process-wide registry is loaded from OBSTACLE_TYPES_FILE on first use.
+    """
+    global _registry
+    if _registry is None:
+        _registry = ObstacleTypeRegistry.from_file()
+    return _registry.get(name)
@@ -0,0 +1,59 @@
+class SnapshotNode:
+    """
+    Read-only copy of one AVL node: its key and its place in the tree shape.
+
+    Provides the same read getters as AVLNode (keys, height, children), so
+    layout and rendering code can work on snapshots and live trees alike,
+    plus the number of nodes in its subtree.
+    """
+
+    __slots__ = ("_x1", "_y1", "_height", "_size", "_left", "_right")
+
+    def __init__(self, x1, y1, height, left=None, right=None):
+        """
+        Initialize a snapshot node.
+
+        Args:
+            x1 (int): X-coordinate key.
+            y1 (int): Y-coordinate key.
+            height (int): Height of the node in the tree.
+            left (SnapshotNode, optional): Left child. Defaults to None.
+            right (SnapshotNode, optional): Right child. Defaults to None.
+        """
+        self._x1 = x1
+        self._y1 = y1
+        self._height = height
+        self._left = left
+        self._right = right
+        self._size = 1 + (left._size if left else 0) + (right._size if right else 0)
+
+    # --- General Getters ---
+    def get_x1(self): return self._x1
+    def get_y1(self): return self._y1
+    def get_height(self): return self._height
+    def get_size(self): return self._size
+    def get_left(self): return self._left
+    def get_right(self): return self._right
+
+
+class TreeSnapshot:
+    """
+    Immutable picture of the AVL tree published after a batch of mutations.
+
+    Attributes:
+        version (int): Version of the tree the snapshot was taken from.
+        root (SnapshotNode | None): Root of the copied tree shape.
+    """
+
+    __slots__ = ("version", "root")
+
+    def __init__(self, version, root):
+        """
+        Initialize a snapshot.
+
+        Args:
+            version (int): Tree version.
+            root (SnapshotNode | None): Root of the copied shape.
+        """
+        self.version = version
+        self.root = root
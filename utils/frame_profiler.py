@@ -0,0 +1,145 @@
+import csv
+import threading
+import time
+
+
+class RingBuffer:
+    """
+    Fixed-size buffer keeping the most recent samples.
+
+    Attributes:
+        size (int): Maximum number of samples kept.
+    """
+
+    def __init__(self, size):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            size (int): Maximum number of samples kept.
+        """
+        self.size = size
+        self._samples = [0] * size
+        self._next = 0
+        self._count = 0
+
+    def append(self, value):
+        """Store a sample, overwriting the oldest one when full."""
+        self._samples[self._next] = value
+        self._next = (self._next + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+
+    def values(self):
+        """Return the stored samples, oldest first."""
+        if self._count < self.size:
+            return self._samples[:self._count]
+        return self._samples[self._next:] + self._samples[:self._next]
+
+    def __len__(self):
+        return self._count
+
+
+class FrameProfiler:
+    """
+    Times the phases of the game loop with perf_counter_ns.
+
+    Each phase keeps its most recent durations (in nanoseconds) in a ring
+    buffer, so memory stays constant however long the game runs. Phases are
+    timed by chaining: start = profiler.now(), then after each phase
+    start = profiler.record(name, start). Recording is safe from other
+    threads (e.g., the tree render thread).
+
+    Attributes:
+        PHASES (tuple[str]): Known phases, in display order.
+        size (int): Samples kept per phase.
+    """
+
+    PHASES = ("events", "input", "update_obstacles", "cleanup", "publish",
+              "draw_game", "draw_road", "draw_obstacles", "draw_car", "draw_ui",
+              "draw_tree", "flip", "frame", "tree_render")
+
+    def __init__(self, size=600):
+        """
+        Initialize the profiler.
+
+        Args:
+            size (int, optional): Samples kept per phase. Defaults to 600 (10 s at 60 FPS).
+        """
+        self.size = size
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def now():
+        """Return the current time in nanoseconds."""
+        return time.perf_counter_ns()
+
+    def record(self, phase, start_ns):
+        """
+        Record the time elapsed since start_ns for a phase.
+
+        Args:
+            phase (str): Phase name.
+            start_ns (int): Start time from now() or a previous record().
+
+        Returns:
+            int: The current time, to be used as the start of the next phase.
+        """
+        end_ns = time.perf_counter_ns()
+        buffer = self._buffers.get(phase)
+        if buffer is None:
+            with self._lock:
+                buffer = self._buffers.setdefault(phase, RingBuffer(self.size))
+        buffer.append(end_ns - start_ns)
+        return end_ns
+
+    def phases(self):
+        """Return the recorded phase names, known phases first."""
+        recorded = list(self._buffers)
+        return ([p for p in self.PHASES if p in self._buffers]
+                + sorted(p for p in recorded if p not in self.PHASES))
+
+    def samples(self, phase):
+        """
+        Return a phase's recent durations, oldest first, in milliseconds.
+
+        Args:
+            phase (str): Phase name.
+
+        Returns:
+            list[float]: Stored durations; empty if the phase was never recorded.
+        """
+        buffer = self._buffers.get(phase)
+        return [value / 1e6 for value in buffer.values()] if buffer else []
+
+    def percentiles(self, phase, ranks=(50, 95, 99)):
+        """
+        Return percentiles of a phase's recent durations, in milliseconds.
+
+        Args:
+            phase (str): Phase name.
+            ranks (Iterable[int], optional): Percentiles to compute. Defaults to (50, 95, 99).
+
+        Returns:
+            list[float]: One value per rank (nearest-rank method); empty if no samples.
+        """
+        buffer = self._buffers.get(phase)
+        samples = sorted(buffer.values()) if buffer else []
+        if not samples:
+            return []
+        last = len(samples) - 1
+        return [samples[min(last, max(0, -(-rank * len(samples) // 100) - 1))] / 1e6 for rank in ranks]
+
+    def export_csv(self, path):
+        """
+        Write every stored sample to a CSV file (phase, sample, duration_ms).
+
+        Args:
+            path (str): Output file path.
+        """
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["phase", "sample", "duration_ms"])
+            for phase in self.phases():
+                for i, value in enumerate(self._buffers[phase].values()):
+                    writer.writerow([phase, i, f"{value / 1e6:.4f}"])
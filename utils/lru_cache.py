@@ -0,0 +1,56 @@
+from collections import OrderedDict
+
+class LRUCache:
+    """
+    Bounded mapping that evicts the least recently used entry when full.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept in the cache.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that had to build the value.
+    """
+
+    def __init__(self, max_size=128):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size (int, optional): Maximum number of entries. Defaults to 128.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get_or_create(self, key, factory):
+        """
+        Return the cached value for key, building it with factory() on a miss.
+
+        Args:
+            key: Hashable cache key.
+            factory (callable): Zero-argument function that builds the value.
+
+        Returns:
+            The cached or newly built value.
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+
+        self.misses += 1
+        value = factory()
+        entries[key] = value
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove every entry and reset the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,37 @@
+import pygame
+from utils.lru_cache import LRUCache
+
+# Decoded source images, one per file (few distinct files, never evicted)
+_sources = {}
+
+# Scaled sprites keyed by (path, width, height)
+_scaled = LRUCache(max_size=256)
+
+
+def load_sprite(path: str, width: int, height: int):
+    """
+    Return the image at path scaled to (width, height), shared process-wide.
+
+    Each file is decoded once and each (path, width, height) combination is
+    scaled once, so load time and memory follow the number of distinct sprites
+    instead of the number of obstacles. Callers must not draw onto the result.
+
+    Note:
+        Requires an initialised display (convert_alpha).
+
+    Args:
+        path (str): Path to the image file.
+        width (int): Target width in pixels.
+        height (int): Target height in pixels.
+
+    Returns:
+        pygame.Surface: The shared scaled sprite.
+    """
+    def scale():
+        source = _sources.get(path)
+        if source is None:
+            source = pygame.image.load(path).convert_alpha()
+            _sources[path] = source
+        return pygame.transform.scale(source, (width, height))
+
+    return _scaled.get_or_create((path, width, height), scale)
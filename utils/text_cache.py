@@ -0,0 +1,56 @@
+import pygame
+from utils.lru_cache import LRUCache
+
+# Fonts keyed by (name, size, bold); only a handful exist, never evicted
+_fonts = {}
+
+# Rendered text keyed by (name, size, bold, text, color)
+_texts = LRUCache(max_size=512)
+
+
+def get_font(name=None, size=24, bold=False):
+    """
+    Return a shared font, creating it on first use.
+
+    Args:
+        name (str, optional): System font name; None uses pygame's default font.
+        size (int, optional): Font size. Defaults to 24.
+        bold (bool, optional): Bold variant. Defaults to False.
+
+    Returns:
+        pygame.font.Font: The shared font.
+    """
+    key = (name, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        if name is None:
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+        else:
+            font = pygame.font.SysFont(name, size, bold=bold)
+        _fonts[key] = font
+    return font
+
+
+def render_text(text, size=24, color=(255, 255, 255), name=None, bold=False):
+    """
+    Return text rendered (antialiased) with a shared font, cached process-wide.
+
+    Unchanged labels are rendered once instead of once per frame; the cache
+    is bounded, so text that changes every frame only evicts older entries.
+    Callers must not draw onto the result. Use from the game loop thread only.
+
+    Args:
+        text (str): Text to render.
+        size (int, optional): Font size. Defaults to 24.
+        color (tuple, optional): RGB text colour. Defaults to white.
+        name (str, optional): System font name; None uses pygame's default font.
+        bold (bool, optional): Bold variant. Defaults to False.
+
+    Returns:
+        pygame.Surface: The shared rendered text.
+    """
+    return _texts.get_or_create(
+        (name, size, bold, text, color),
+        lambda: get_font(name, size, bold).render(text, True, color),
+    )
@@ -1,15 +1,31 @@
 import pygame
 import threading
+import time
 from views.game_view import GameView
 from views.tree_view import TreeView
+from views.profiler_overlay import ProfilerOverlay
 from controllers.obstacle_cleanup_controller import ObstacleCleanupController
+from controllers.input_source import KeyboardInput
+from utils.frame_profiler import FrameProfiler
 
 
 class GameCoordinator:
     """
     Coordinates the main game logic and the AVL tree visualization.
 
+    The game is simulated in fixed ticks of 1 / tick_rate seconds, independent
+    of the frame rate: every frame, the elapsed real time (times time_scale)
+    is added to an accumulator that is spent in whole ticks, and the views
+    are drawn interpolated between the last two ticks. A slow frame therefore
+    runs several ticks instead of slowing the game down, and frames can be
+    drawn faster than ticks (max_fps 0 = uncapped) or ticks run faster than
+    real time (time_scale > 1, TIME_SCALE_HOTKEY cycles it).
+
+    In headless mode nothing is drawn: run_headless() steps the simulation as
+    fast as the CPU allows (use the SDL dummy video driver on a server).
+
     Attributes:
+        TIME_SCALE_HOTKEY (int): Key that cycles the simulation speed (F4).
         config (dict): Game configuration settings.
         avl_controller (AVLTreeController): Controller managing the AVL tree.
         game_view (GameView): View responsible for rendering the game area.
@@ -19,41 +35,91 @@ class GameCoordinator:
         HEIGHT (int): Total height of the display.
         screen (pygame.Surface): Pygame surface for rendering.
         clock (pygame.time.Clock): Pygame clock to control FPS.
-        tree_update_event (threading.Event): Event to trigger AVL tree redraw.
+        tree_update_event (threading.Event): Event to trigger AVL tree redraw
+            (the tree view's render_event).
         running (bool): Game loop running flag.
+        dirty_rects (bool): Update only the screen areas the views report as
+            changed, instead of redrawing and flipping the whole window.
+        profiler (FrameProfiler): Timings of every phase of the loop and of tree renders.
+        profiler_overlay (ProfilerOverlay): Percentile table toggled with F3.
+        profile_csv (str | None): File the timings are exported to on exit.
+        tick_rate (int): Simulation ticks per second.
+        max_fps (int): Frame rate cap, 0 for uncapped.
+        time_scale (float): Simulated seconds per real second.
+        ticks (int): Simulation ticks run so far, paused ones included.
+        input_source (InputSource): Player input per tick, including pause presses
+            and tree panel clicks, so a recorded session replays identically.
+        headless (bool): No render thread, no tree rendering and no change tracking.
+        log_removed (bool): Print the obstacles removed by each cleanup and the
+            tree contents (config "log_removed", always off when headless).
         tree_thread (threading.Thread): Background thread for updating the tree view.
     """
 
-    def __init__(self, config, avl_controller, obstacles_file="config/obstacles.json"):
+    TIME_SCALE_HOTKEY = pygame.K_F4
+
+    def __init__(self, config, avl_controller, input_source=None, headless=False):
         """
-        Initializes the GameCoordinator with configuration, AVL controller,
-        and optional obstacles file.
+        Initializes the GameCoordinator with configuration and the AVL controller
+        that holds the level's obstacles.
+
+        Args:
+            config (dict): Game configuration settings.
+            avl_controller (AVLTreeController): Controller holding the level's obstacles.
+            input_source (InputSource, optional): Source of the per-tick input. Defaults to the keyboard.
+            headless (bool, optional): Skip the tree rendering thread. Defaults to False.
         """
         self.config = config
         self.avl_controller = avl_controller
+        self.input_source = input_source or KeyboardInput()
+        self.headless = headless
+        self.log_removed = config.get("log_removed", False) and not headless
+
+        # Display setup (before the views, which convert their images to it)
+        self.WIDTH = GameView.GAME_WIDTH + TreeView.TREE_WIDTH
+        self.HEIGHT = GameView.HEIGHT
+        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
+        pygame.display.set_caption("Car Game + AVL Tree")
+        self.clock = pygame.time.Clock()
+
+        # Instrumentation, shared with the game view
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler, bottom_left=(10, self.HEIGHT - 10))
+        self.profile_csv = config.get("profile_csv")
 
         # Views
-        self.game_view = GameView(config, obstacles_file)
-        self.tree_view = TreeView(avl_controller, self.game_view.GAME_WIDTH)
+        self.game_view = GameView(config, avl_controller, self.profiler)
+        self.tree_view = TreeView(avl_controller, self.game_view.GAME_WIDTH,
+                                  backend=config.get("tree_renderer", "pygame"))
 
         # Obstacle cleanup controller
         self.cleanup_controller = ObstacleCleanupController(avl_controller)
+        self.dirty_rects = config.get("dirty_rects", True)
+        self._full_redraw = True  # Redraw everything on the next frame
 
-        # Display setup
-        self.WIDTH = self.game_view.GAME_WIDTH + self.tree_view.TREE_WIDTH
-        self.HEIGHT = self.game_view.HEIGHT
-        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
-        pygame.display.set_caption("Car Game + AVL Tree")
-        self.clock = pygame.time.Clock()
+        # Fixed-timestep simulation
+        self.tick_rate = config.get("tick_rate", 60)
+        self.max_fps = config.get("max_fps", 60)
+        self.time_scale = config.get("time_scale", 1.0)
+        self.ticks = 0
 
         # Pass the screen to views
         self.game_view.set_screen(self.screen)
         self.tree_view.set_screen(self.screen)
 
-        # Thread synchronization
-        self.tree_update_event = threading.Event()
+        # Thread synchronization: the render thread only sees published snapshots
+        self.tree_update_event = self.tree_view.render_event
         self.running = True
 
+        self.tree_thread = None
+        if headless:
+            # No snapshots are published, so nothing would drain the recorded changes
+            self.avl_controller.set_change_tracking(False)
+            return
+
+        # First tree image, drawn before the game loop starts
+        self.tree_view.submit_snapshot(self.avl_controller.publish_snapshot())
+        self.tree_view.render_pending()
+
         # AVL tree background thread
         self.tree_thread = threading.Thread(target=self._tree_loop, daemon=True)
         self.tree_thread.start()
@@ -61,25 +127,127 @@ class GameCoordinator:
     def _tree_loop(self):
         """
         Background thread responsible for regenerating the tree view
-        without freezing the main game loop.
+        without freezing the main game loop. It draws from the snapshots
+        published by the game loop, never from the live AVL tree.
         """
         while self.running:
             if self.tree_update_event.wait(timeout=0.1):
+                # Clear first so requests made during the render are not lost
+                self.tree_update_event.clear()
                 try:
-                    self.tree_view.tree_surface = self.tree_view.create_tree_surface()
+                    start = self.profiler.now()
+                    self.tree_view.render_pending()
+                    self.profiler.record("tree_render", start)
                 except Exception as e:
                     print(f"⚠️ Error in tree thread: {e}")
-                finally:
-                    self.tree_update_event.clear()
 
-    def run(self):
+    def step(self):
         """
-        Main game loop: handles events, updates game logic, redraws the
-        game and tree views, and manages obstacle cleanup.
+        Advance the simulation by one fixed tick: pause and tree panel clicks,
+        input, scrolling, collisions, obstacle cleanup and progress.
+        Paused ticks still count (and read input, to be unpaused); once the
+        game is finished nothing happens.
         """
+        game_view = self.game_view
+        if game_view.game_over or game_view.game_won:
+            game_view.begin_tick()  # Nothing moves, so nothing to interpolate
+            return
+        profiler = self.profiler
+        tick_input = self.input_source.read(self.ticks)
+        self.ticks += 1
+        game_view.begin_tick()
+
+        if tick_input.pause:
+            game_view.button_controller.toggle_pause()
+        for pos in tick_input.clicks:
+            self.tree_view.handle_click(pos)
+        if game_view.button_controller.is_paused():
+            return
+
+        t = profiler.now()
+        game_view.handle_input(tick_input)
+        t = profiler.record("input", t)
+
+        dx = game_view.car.get_speed_x() or 5
+        game_view.update_obstacles(dx)
+        t = profiler.record("update_obstacles", t)
+
+        removed = self.cleanup_controller.cleanup_obstacles(
+            game_view.obstacles,
+            game_view.camera_x
+        )
+        if removed and self.log_removed:
+            print("🗑️ Obstacles removed from the screen:")
+            for obs in removed:
+                print(f" - {obs.type} at ({obs.rect.left}, {obs.rect.top})")
+
+            print("🌳 Current AVL tree state (in-order):")
+            current_tree = self.avl_controller.inorder()
+            print(" -> ".join(current_tree) if current_tree else " Empty tree")
+        profiler.record("cleanup", t)
+        game_view.update_progress(dx)
+
+    def run_headless(self, max_ticks=None):
+        """
+        Step the simulation as fast as possible, without drawing, until the
+        game is won or lost or max_ticks ticks have run.
+
+        Args:
+            max_ticks (int, optional): Tick limit. Defaults to no limit.
+
+        Returns:
+            dict: ticks, collisions, energy, distance, wall_time (seconds) and
+            outcome ("won", "lost" or "running").
+        """
+        game_view = self.game_view
+        start = time.perf_counter()
+        while not (game_view.game_won or game_view.game_over):
+            if max_ticks is not None and self.ticks >= max_ticks:
+                break
+            self.step()
+        wall_time = time.perf_counter() - start
+
+        if game_view.game_won:
+            outcome = "won"
+        elif game_view.game_over:
+            outcome = "lost"
+        else:
+            outcome = "running"
+        return {
+            "ticks": self.ticks,
+            "collisions": game_view.collisions,
+            "energy": game_view.car.get_energy(),
+            "distance": game_view.distance,
+            "wall_time": wall_time,
+            "outcome": outcome,
+        }
+
+    def cycle_time_scale(self):
+        """Cycle the simulation speed through 1x, 2x, 4x and 8x."""
+        self.time_scale = self.time_scale * 2 if self.time_scale < 8 else 1.0
+        print(f"⏩ Simulation speed x{self.time_scale:g}")
+
+    def run(self, max_ticks=None):
+        """
+        Main game loop: handles events, runs the fixed simulation ticks due
+        since the previous frame, and redraws the game and tree views.
+
+        Args:
+            max_ticks (int, optional): Close the game after this many ticks
+                (e.g., the length of a replayed recording). Defaults to no limit.
+        """
+        profiler = self.profiler
+        tick_seconds = 1.0 / self.tick_rate
+        accumulator = 0.0
+        previous = time.perf_counter()
         while self.running:
-            # Clear the screen
-            self.screen.fill((45, 45, 55))
+            frame_start = t = profiler.now()
+
+            # Clear the screen (the views cover it, so only for full redraws)
+            full_redraw = self._full_redraw or not self.dirty_rects
+            self._full_redraw = False
+            if full_redraw:
+                self.screen.fill((45, 45, 55))
 
             # Event handling
             events = pygame.event.get()
@@ -87,51 +255,68 @@ class GameCoordinator:
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # Pass clicks to TreeView (buttons and inputs)
-                    self.tree_view.handle_click(event.pos)
+                    # Clicks on the tree panel (buttons and inputs) are applied
+                    # with the next tick, or right away once the game is over
+                    if self.tree_view.panel_rect.collidepoint(event.pos):
+                        if self.game_view.game_over or self.game_view.game_won:
+                            self.tree_view.handle_click(event.pos)
+                        else:
+                            self.input_source.push_click(event.pos)
+                    self.tree_view.handle_viewport_event(event)
+                elif event.type in (pygame.MOUSEWHEEL, pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP):
+                    # Zoom and pan of the tree panel
+                    self.tree_view.handle_viewport_event(event)
+                elif event.type == pygame.KEYDOWN and event.key == self.profiler_overlay.HOTKEY:
+                    self.profiler_overlay.toggle()
+                    self._full_redraw = True  # Uncover what the overlay hid
+                elif event.type == pygame.KEYDOWN and event.key == self.TIME_SCALE_HOTKEY:
+                    self.cycle_time_scale()
                 elif event.type == pygame.KEYDOWN:
                     # Pass key input to TreeView (text input)
                     self.tree_view.handle_key(event)
 
-            # Pass events to GameView (pause button, etc.)
-            self.game_view.handle_events(events)
-
-            # Main game logic
-            if not self.game_view.button_controller.is_paused():
-
-                # Process logic only if the game is NOT over
-                if not (self.game_view.game_over or self.game_view.game_won):
-                    self.game_view.handle_input()
-
-                    dx = self.game_view.car.get_speed_x() or 5
-                    self.game_view.update_obstacles(dx)
-
-                    # Remove obstacles only while the game is running
-                    removed = self.cleanup_controller.cleanup_obstacles(
-                        self.game_view.obstacles,
-                        self.game_view.GAME_WIDTH
-                    )
+            # Pass events to GameView; a pause press is applied with the next tick
+            if self.game_view.handle_events(events) == "pause":
+                self.input_source.push_pause()
+            profiler.record("events", t)
 
-                    if removed:
-                        print("🗑️ Obstacles removed from the screen:")
-                        for obs in removed:
-                            print(f" - {obs.type} at ({obs.rect.left}, {obs.rect.top})")
+            # Run the ticks due; a long stall is capped instead of replayed
+            now = time.perf_counter()
+            accumulator += min(now - previous, 0.25) * self.time_scale
+            previous = now
+            while accumulator >= tick_seconds:
+                self.step()
+                accumulator -= tick_seconds
+            if max_ticks is not None and self.ticks >= max_ticks:
+                self.running = False
 
-                        print("🌳 Current AVL tree state (in-order):")
-                        current_tree = self.avl_controller.inorder()
-                        print(" -> ".join(current_tree) if current_tree else " Empty tree")
+            # Publish the mutated tree to the render thread
+            t = profiler.now()
+            self.tree_view.submit_snapshot(self.avl_controller.publish_snapshot())
 
-                        # Signal to regenerate the tree
-                        self.tree_update_event.set()
+            # Advance the traversal animation (non-blocking)
+            self.tree_view.update()
+            t = profiler.record("publish", t)
 
-            # Drawing
-            self.game_view.draw_game_area()
-            self.tree_view.draw_tree_area()
+            # Drawing, between the previous and the current tick
+            rects = self.game_view.draw_game_area(full_redraw, accumulator / tick_seconds)
+            t = profiler.record("draw_game", t)
+            rects += self.tree_view.draw_tree_area(full_redraw)
+            rects += self.profiler_overlay.draw(self.screen)
+            t = profiler.record("draw_tree", t)
 
-            pygame.display.flip()
-            self.clock.tick(60)
+            if full_redraw:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+            profiler.record("flip", t)
+            profiler.record("frame", frame_start)
+            self.clock.tick(self.max_fps)
 
         # Gracefully close
         self.running = False
         self.tree_update_event.set()
-        pygame.quit()
\ No newline at end of file
+        if self.profile_csv:
+            self.profiler.export_csv(self.profile_csv)
+            print(f"Frame timings written to {self.profile_csv}")
+        pygame.quit()
@@ -2,34 +2,58 @@ import pygame
 from controllers.button_controller import ButtonController
 from models.car import Car
 from controllers.car_controller import CarController
-from models.obstacle import Obstacle
-from utils.file_admin import read_json
+from controllers.input_source import KeyboardInput
+from controllers.obstacle_generator import ObstacleGenerator
 from components.button import Button
+from utils.sprite_cache import load_sprite
+from utils.text_cache import render_text
+from utils.frame_profiler import FrameProfiler
 
 class GameView:
     """
     Main game view for the road game.
     Handles rendering the road, car, obstacles, UI, and pause logic.
+
+    The AVL tree is the single source of obstacles: only the obstacles inside
+    the camera window (plus STREAM_MARGIN) are kept active, and new ones are
+    pulled from the tree with an x-range query as the road scrolls. When the
+    configuration enables the procedural generator, the tree itself is filled
+    chunk by chunk just before the range query needs them.
+
+    draw_game_area reports the screen areas it changed, so the coordinator can
+    update only those: while the road scrolls that is the whole game area,
+    while paused or finished nothing is redrawn until the state changes.
+
+    The game advances in fixed ticks driven by the coordinator (begin_tick,
+    handle_input, update_obstacles, update_progress); drawing only reads the
+    state, interpolating the camera and the car between the last two ticks.
+    Each part of the drawing (road, obstacles, car, UI) is timed separately
+    on the view's profiler.
     """
 
     GAME_WIDTH = 800
     HEIGHT = 800
+    STREAM_MARGIN = 200  # World pixels ahead of the screen that are pre-loaded
 
-    def __init__(self, config, obstacles_file="config/obstacles.json"):
+    def __init__(self, config, avl_controller, profiler=None):
         """
         Initialize the game view.
 
         Args:
             config: Dictionary with game configuration (refresh_time, jump_height, etc.)
-            obstacles_file: Path to the JSON file with obstacle definitions.
+            avl_controller: AVLTreeController holding every obstacle of the level.
+            profiler (FrameProfiler, optional): Records the drawing phases. Defaults to a new one.
         """
         self.config = config
+        self.avl_controller = avl_controller
+        self.profiler = profiler or FrameProfiler()
         self.road_length = config["road_length"]
         self.screen = None
         self.clock = pygame.time.Clock()
         self.game_won = False
         self.game_over = False
         self.distance = 0  # Distance traveled
+        self.collisions = 0  # Obstacles hit so far
 
         # Pause button and controller
         self.pause_button = Button(x=self.GAME_WIDTH - 120, y=20, width=100, height=40, text="PAUSE")
@@ -52,45 +76,60 @@ class GameView:
         # Car images
         width = self.car.get_x2() - self.car.get_x1()
         height = self.car.get_y2() - self.car.get_y1()
-        self.blue_car = pygame.transform.scale(
-            pygame.image.load("views/assets/blue_car.png").convert_alpha(),
-            (width, height)
-        )
-        self.red_car = pygame.transform.scale(
-            pygame.image.load("views/assets/red_car.png").convert_alpha(),
-            (width, height)
-        )
-
-        # Road background
-        self.road_img = pygame.image.load("views/assets/5_lines.png").convert_alpha()
-        self.road_offset = 0
-
-        # Load obstacles
-        data = read_json(obstacles_file)
-        self.obstacles = [Obstacle(obs) for obs in data["obstacles"]]
+        self.blue_car = load_sprite("views/assets/blue_car.png", width, height)
+        self.red_car = load_sprite("views/assets/red_car.png", width, height)
+        self.car_shadow = pygame.Surface((width, height))
+        self.car_shadow.fill((0, 0, 0))
+        self.car_shadow.set_alpha(50)
+
+        # Road background, pre-composited into one opaque strip
+        self.road_strip = self._build_road_strip("views/assets/5_lines.png")
+
+        # Active obstacles, streamed from the AVL tree (generated ahead of the camera if enabled)
+        self.generator = ObstacleGenerator.from_config(config)
+        self.obstacles = []
+        self.camera_x = 0  # World x of the left edge of the screen (scroll offset)
+        self.streamed_until = float("-inf")  # Obstacles with x1 <= this were already pulled
+        self.stream_obstacles()
+
+        # State at the start of the current tick, for interpolated drawing
+        self.prev_camera_x = self.camera_x
+        self.prev_car_y = self._car_draw_y()
 
         # Pause state
         self.paused = False
 
+        # Static part of the UI panel, drawn once
+        self.ui_panel = self._build_ui_panel()
+
+        # Dirty-region tracking
+        self.area_rect = pygame.Rect(0, 0, self.GAME_WIDTH, self.HEIGHT)
+        self._drawn_state = None  # Static state shown by the last redraw
+
     def set_screen(self, screen):
         """Assign the Pygame screen surface for rendering."""
         self.screen = screen
 
-    def handle_input(self):
+    def handle_input(self, tick_input=None):
         """
-        Handle keyboard input to move or jump the car.
+        Handle player input to move or jump the car.
         Does nothing if the game is paused.
+
+        Args:
+            tick_input (TickInput, optional): Input of this tick. Defaults to
+                the live keyboard state.
         """
         if self.button_controller.is_paused() or self.game_won:
             return
 
-        keys = pygame.key.get_pressed()
+        if tick_input is None:
+            tick_input = KeyboardInput().read(0)
         if not self.car.is_jumping():
-            if keys[pygame.K_UP]:
+            if tick_input.up:
                 self.car_controller.move_up()
-            if keys[pygame.K_DOWN]:
+            if tick_input.down:
                 self.car_controller.move_down()
-            if keys[pygame.K_SPACE]:
+            if tick_input.jump:
                 self.car.set_jumping(True)
 
         # Car no longer moves forward in X, only vertical and jump
@@ -104,125 +143,227 @@ class GameView:
             events: List of Pygame events.
 
         Returns:
-            "quit" if the user wants to exit, otherwise None.
+            "quit" if the user wants to exit, "pause" if the pause button was
+            pressed (to be applied at the next tick), otherwise None.
         """
+        result = None
         for event in events:
             if event.type == pygame.QUIT:
                 return "quit"
-            self.button_controller.handle_pause_button(self.pause_button, event)
-        return None
+            if self.button_controller.handle_pause_button(self.pause_button, event):
+                result = "pause"
+        return result
+
+    def _car_draw_y(self):
+        """Return the y where the car is drawn (position plus jump offset)."""
+        return self.car.get_y1() + self.car.get_jump_offset()
+
+    def begin_tick(self):
+        """Remember the state at the start of a simulation tick, for interpolation."""
+        self.prev_camera_x = self.camera_x
+        self.prev_car_y = self._car_draw_y()
+
+    def update_progress(self, dx):
+        """
+        Advance the distance traveled by one tick and detect the end of the game.
+
+        Args:
+            dx: Distance covered in this tick.
+        """
+        self.distance += dx
+        if self.distance >= self.road_length:
+            self.game_won = True
+        if self.car.get_energy() <= 0:
+            self.game_over = True
+
+    def stream_obstacles(self):
+        """
+        Activate the obstacles that entered the camera window (plus margin)
+        since the last call, using an x-range query on the AVL tree.
+        """
+        horizon = self.camera_x + self.GAME_WIDTH + self.STREAM_MARGIN
+        if horizon <= self.streamed_until:
+            return
+
+        if self.generator is not None:
+            self.generator.fill(self.avl_controller, horizon)
+        for node in self.avl_controller.iter_range(self.streamed_until + 1, horizon):
+            self.obstacles.append(node.get_obstacle())
+        self.streamed_until = horizon
 
     def update_obstacles(self, dx):
         """
-        Update all obstacles' positions and check collisions with the car.
+        Scroll the camera, stream in new obstacles and check collisions with the car.
+        Obstacles stay fixed in world coordinates, so scrolling is O(1).
+        Called exactly once per frame.
 
         Args:
-            dx: Amount to scroll obstacles horizontally.
+            dx: Amount to scroll horizontally.
         """
         if self.button_controller.is_paused():
             return
 
-        for obs in self.obstacles:
-            obs.update(dx)
-            if (not self.car.is_jumping() and
-                    self.car.get_collision_rect().colliderect(obs.rect) and
-                    not obs.hit):
+        self.camera_x += dx
+        self.stream_obstacles()
+
+        self.check_collisions()
+
+    def check_collisions(self):
+        """
+        Apply damage for obstacles hit by the car.
+
+        Broad phase: ask the AVL tree only for obstacles whose extent overlaps
+        the car's band. Narrow phase: exact rectangle test against the car's
+        collision rect, built once per frame and moved into world coordinates.
+        """
+        if self.car.is_jumping():
+            return
+
+        car_rect = self.car.get_collision_rect()
+        car_rect.x += self.camera_x
+        candidates = self.avl_controller.iter_overlapping(
+            car_rect.left, car_rect.right, car_rect.top, car_rect.bottom
+        )
+        for node in candidates:
+            obs = node.get_obstacle()
+            if not obs.hit and car_rect.colliderect(obs.rect):
                 self.car.decrease_energy(obs.damage)
                 obs.hit = True
+                self.collisions += 1
 
-    def draw_game_area(self):
+    def _build_road_strip(self, path):
+        """
+        Compose the road into an opaque strip two screens wide: the road image
+        tiled down the screen, once at x=0 and once at x=GAME_WIDTH, over the
+        background colour. Any scroll offset in (-GAME_WIDTH, 0] is then one blit.
+        The image has a few transparent border pixels, so it is blended once
+        here instead of on every frame.
+
+        Args:
+            path (str): Path to the road image.
+
+        Returns:
+            pygame.Surface: Strip of size (2 * GAME_WIDTH, HEIGHT).
+        """
+        strip = pygame.Surface((2 * self.GAME_WIDTH, self.HEIGHT)).convert()
+        strip.fill((45, 45, 55))
+        road_img = pygame.image.load(path).convert_alpha()
+        for y in range(0, self.HEIGHT, road_img.get_height()):
+            strip.blit(road_img, (0, y))
+            strip.blit(road_img, (self.GAME_WIDTH, y))
+        return strip
+
+    def _static_state(self):
+        """Return what the game area shows while the road is not scrolling."""
+        return (self.button_controller.is_paused(), self.game_won, self.game_over,
+                self.pause_button.hovered)
+
+    def draw_game_area(self, full=False, alpha=1.0):
         """
         Render the game area including road, obstacles, car, pause button, and UI.
         Handles scrolling and visual jump offset.
+
+        Args:
+            full (bool, optional): Redraw even if nothing changed. Defaults to False.
+            alpha (float, optional): Position between the previous tick (0) and the
+                current one (1) to draw the camera and the car at. Defaults to 1.
+
+        Returns:
+            list[pygame.Rect]: Screen areas that were redrawn.
         """
-        dx = self.car.get_speed_x() or 5
-
-        # Draw road background repeatedly in Y
-        img_height = self.road_img.get_height()
-        for y in range(0, self.HEIGHT, img_height):
-            self.screen.blit(self.road_img, (self.road_offset, y))
-            self.screen.blit(self.road_img, (self.road_offset + self.GAME_WIDTH, y))
-
-        # Scroll the road if not paused and game not finished
-        if not self.button_controller.is_paused() and not (self.game_won or self.game_over):
-            self.road_offset -= dx
-            if self.road_offset <= -self.GAME_WIDTH:
-                self.road_offset = 0
-
-            # Advance distance
-            self.distance += dx
-            if self.distance >= self.road_length:
-                self.game_won = True
-
-        # Update obstacles only if game is ongoing
+        scrolling = not self.button_controller.is_paused() and not (self.game_won or self.game_over)
+        if not (full or scrolling or self._static_state() != self._drawn_state):
+            return []
+
+        profiler = self.profiler
+        t = profiler.now()
+
+        # Obstacles entering on the right must not spill onto the tree panel
+        self.screen.set_clip(self.area_rect)
+        camera_x = round(self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha)
+
+        # Draw the road (one blit, whatever the screen height)
+        self.screen.blit(self.road_strip, (-(camera_x % self.GAME_WIDTH), 0))
+        t = profiler.record("draw_road", t)
+
+        # Draw obstacles only if game is ongoing (they are updated by the game loop)
         if not (self.game_won or self.game_over):
-            self.update_obstacles(dx)
             for obs in self.obstacles:
-                obs.draw(self.screen)
+                obs.draw(self.screen, camera_x)
+        t = profiler.record("draw_obstacles", t)
 
         # Draw the car with jump offset
         car_img = self.red_car if self.car.is_jumping() else self.blue_car
-        car_x, car_y = self.car.get_x1(), self.car.get_y1() + self.car.get_jump_offset()
+        car_x = self.car.get_x1()
+        car_y = round(self.prev_car_y + (self._car_draw_y() - self.prev_car_y) * alpha)
         if not self.car.is_jumping():
-            shadow_surface = pygame.Surface((car_img.get_width(), car_img.get_height()))
-            shadow_surface.fill((0, 0, 0))
-            shadow_surface.set_alpha(50)
-            self.screen.blit(shadow_surface, (car_x + 3, car_y + 3))
+            self.screen.blit(self.car_shadow, (car_x + 3, car_y + 3))
         self.screen.blit(car_img, (car_x, car_y))
+        t = profiler.record("draw_car", t)
 
         # Draw pause button
         self.pause_button.draw(self.screen)
 
         # Show PAUSE message if paused
         if self.button_controller.is_paused():
-            font = pygame.font.Font(None, 72)
-            text_surf = font.render("PAUSE", True, (255, 0, 0))
-            text_rect = text_surf.get_rect(center=(self.GAME_WIDTH // 2, self.HEIGHT // 2))
-            self.screen.blit(text_surf, text_rect)
+            self._draw_message("PAUSE", (255, 0, 0))
 
         # Show YOU WIN message
         if self.game_won:
-            font = pygame.font.Font(None, 72)
-            text_surf = font.render("YOU WIN!", True, (0, 255, 0))
-            text_rect = text_surf.get_rect(center=(self.GAME_WIDTH // 2, self.HEIGHT // 2))
-            self.screen.blit(text_surf, text_rect)
+            self._draw_message("YOU WIN!", (0, 255, 0))
 
         # Show GAME OVER message if player ran out of energy
-        if self.car.get_energy() <= 0:
-            self.game_over = True
         if self.game_over:
-            font = pygame.font.Font(None, 72)
-            text_surf = font.render("GAME OVER", True, (255, 0, 0))
-            text_rect = text_surf.get_rect(center=(self.GAME_WIDTH // 2, self.HEIGHT // 2))
-            self.screen.blit(text_surf, text_rect)
+            self._draw_message("GAME OVER", (255, 0, 0))
 
         # Draw UI (energy, jump status, progress bar)
         self.draw_ui()
 
+        self.screen.set_clip(None)
+        profiler.record("draw_ui", t)
+        self._drawn_state = self._static_state()
+        return [self.area_rect]
+
+    def _draw_message(self, text, color):
+        """Draw a large message centered on the game area."""
+        text_surf = render_text(text, 72, color)
+        text_rect = text_surf.get_rect(center=(self.GAME_WIDTH // 2, self.HEIGHT // 2))
+        self.screen.blit(text_surf, text_rect)
+
+    def _build_ui_panel(self):
+        """
+        Pre-render the parts of the UI panel that never change: translucent
+        background, border, titles and the empty bars.
+
+        Returns:
+            pygame.Surface: Per-pixel alpha surface blitted at (0, 0).
+        """
+        panel = pygame.Surface((350, 160), pygame.SRCALPHA)
+
+        # Energy panel (taller to fit progress bar)
+        panel.fill((0, 0, 0, 180), (10, 10, 330, 140))
+        pygame.draw.rect(panel, (100, 150, 255), (10, 10, 330, 140), 2)
+
+        panel.blit(render_text("ENERGY", 28), (20, 20))
+        panel.blit(render_text("PROGRESS", 28), (20, 100))
+
+        # Backgrounds of the energy and progress bars
+        pygame.draw.rect(panel, (100, 100, 100), (20, 45, 200, 15))
+        pygame.draw.rect(panel, (100, 100, 100), (20, 125, 200, 15))
+        return panel
+
     def draw_ui(self):
         """
         Draw the game's UI including energy panel, energy bar, jump status,
         and progress bar (distance traveled).
+        The static panel is pre-rendered; only the values are drawn each frame.
         """
-        font_title = pygame.font.Font(None, 28)
-        font_info = pygame.font.Font(None, 24)
-
-        # Energy panel
-        panel_surface = pygame.Surface((330, 140))  # taller to fit progress bar
-        panel_surface.fill((0, 0, 0))
-        panel_surface.set_alpha(180)
-        self.screen.blit(panel_surface, (10, 10))
-        pygame.draw.rect(self.screen, (100, 150, 255), (10, 10, 330, 140), 2)
-
-        # Energy text
-        energy = self.car.get_energy()
-        energy_text = font_title.render("ENERGY", True, (255, 255, 255))
-        self.screen.blit(energy_text, (20, 20))
+        self.screen.blit(self.ui_panel, (0, 0))
 
         # Energy bar
+        energy = self.car.get_energy()
         bar_width, bar_height = 200, 15
         bar_x, bar_y = 20, 45
-        pygame.draw.rect(self.screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
         energy_width = int((energy / 100) * bar_width)
         if energy > 60:
             energy_color = (0, 255, 0)
@@ -236,20 +377,13 @@ class GameView:
         # Jump status
         jump_status = "JUMPING" if self.car.is_jumping() else "ON ROAD"
         status_color = (255, 100, 100) if self.car.is_jumping() else (100, 255, 100)
-        status_text = font_info.render(jump_status, True, status_color)
+        status_text = render_text(jump_status, 24, status_color)
         self.screen.blit(status_text, (20, 70))
 
         # Progress bar (distance traveled)
-        progress_text = font_title.render("PROGRESS", True, (255, 255, 255))
-        self.screen.blit(progress_text, (20, 100))
-
         progress_bar_width, progress_bar_height = 200, 15
         progress_x, progress_y = 20, 125
 
-        # Background of progress bar
-        pygame.draw.rect(self.screen, (100, 100, 100),
-                         (progress_x, progress_y, progress_bar_width, progress_bar_height))
-
         # Fill according to distance
         progress_ratio = min(self.distance / self.road_length, 1.0)
         progress_fill = int(progress_ratio * progress_bar_width)
@@ -268,7 +402,7 @@ class GameView:
                          (progress_x, progress_y, progress_bar_width, progress_bar_height), 2)
 
         # Progress text (e.g., "350 / 1000")
-        progress_info = font_info.render(
-            f"{int(self.distance)} / {self.road_length}", True, (200, 200, 200)
+        progress_info = render_text(
+            f"{int(self.distance)} / {self.road_length}", 24, (200, 200, 200)
         )
         self.screen.blit(progress_info, (progress_x + progress_bar_width + 10, progress_y - 2))
\ No newline at end of file
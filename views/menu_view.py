@@ -1,4 +1,5 @@
 import pygame
+from utils.text_cache import render_text
 
 class MenuView:
     """
@@ -20,22 +21,18 @@ class MenuView:
         pygame.display.set_caption("Main Menu - Car Game")
         self.clock = pygame.time.Clock()
 
-        # Fonts
-        self.font_title = pygame.font.Font(None, 74)
-        self.font_button = pygame.font.Font(None, 50)
-
     def run(self):
         running = True
         while running:
             self.screen.fill((30, 30, 40))  # Dark background
 
             # Render title text
-            title_text = self.font_title.render("Car Game", True, (255, 255, 255))
+            title_text = render_text("Car Game", 74, (255, 255, 255))
             title_rect = title_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 3))
             self.screen.blit(title_text, title_rect)
 
             # Play button rectangle
-            play_text = self.font_button.render("PLAY", True, (0, 0, 0))
+            play_text = render_text("PLAY", 50, (0, 0, 0))
             play_rect = play_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
             button_rect = play_rect.inflate(40, 20)
 
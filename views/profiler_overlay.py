@@ -0,0 +1,74 @@
+import pygame
+from utils.text_cache import get_font
+
+
+class ProfilerOverlay:
+    """
+    On-screen table with the p50/p95/p99 time of every profiled phase.
+
+    Toggled with HOTKEY. The table is rebuilt every REFRESH_FRAMES frames
+    instead of every frame, so the overlay costs little more than a blit.
+
+    Attributes:
+        HOTKEY (int): Key that shows or hides the overlay.
+        REFRESH_FRAMES (int): Frames between table updates.
+        profiler (FrameProfiler): Source of the timings.
+        visible (bool): Whether the overlay is shown.
+    """
+
+    HOTKEY = pygame.K_F3
+    REFRESH_FRAMES = 30
+    LINE_HEIGHT = 16
+    WIDTH = 330
+
+    def __init__(self, profiler, bottom_left=(10, 790)):
+        """
+        Initialize the overlay.
+
+        Args:
+            profiler (FrameProfiler): Source of the timings.
+            bottom_left (tuple[int, int], optional): Screen anchor of the table.
+        """
+        self.profiler = profiler
+        self.bottom_left = bottom_left
+        self.visible = False
+        self.font = get_font(None, 18)
+        self._surface = None
+        self._frames = 0
+
+    def toggle(self):
+        """Show or hide the overlay."""
+        self.visible = not self.visible
+        self._surface = None
+
+    def draw(self, screen):
+        """
+        Draw the overlay if visible.
+
+        Returns:
+            list[pygame.Rect]: Screen area that was drawn (empty if hidden).
+        """
+        if not self.visible:
+            return []
+        self._frames += 1
+        if self._surface is None or self._frames >= self.REFRESH_FRAMES:
+            self._surface = self._build()
+            self._frames = 0
+        rect = screen.blit(self._surface, self._surface.get_rect(bottomleft=self.bottom_left))
+        return [rect]
+
+    def _build(self):
+        """Render the table of percentiles."""
+        rows = [("phase (ms)", "p50", "p95", "p99")]
+        for phase in self.profiler.phases():
+            rows.append((phase, *(f"{value:.2f}" for value in self.profiler.percentiles(phase))))
+
+        surface = pygame.Surface((self.WIDTH, self.LINE_HEIGHT * len(rows) + 8))
+        surface.fill((20, 20, 20))
+        pygame.draw.rect(surface, (100, 150, 255), surface.get_rect(), 1)
+        columns = (6, 150, 210, 270)
+        for i, row in enumerate(rows):
+            color = (255, 255, 0) if i == 0 else (230, 230, 230)
+            for x, text in zip(columns, row):
+                surface.blit(self.font.render(text, True, color), (x, 4 + i * self.LINE_HEIGHT))
+        return surface
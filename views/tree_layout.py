@@ -0,0 +1,146 @@
+class TreeLayout:
+    """
+    Lazy hierarchical layout of the AVL tree, computed directly from its nodes.
+
+    A node's children share its horizontal span equally and each level sits
+    one row below its parent, so a node's position only depends on its path
+    from the root. Positions are therefore computed top-down on demand: the
+    renderer places the children of the nodes it visits and never descends
+    into subtrees that are off screen or collapsed, so the work per render is
+    bounded by the view, not by the size of the tree. Positions are cached
+    per node key (x1, y1) for as long as the same root is drawn (e.g. while
+    zooming or panning one snapshot).
+
+    Attributes:
+        positions (dict[tuple, tuple[float, float, int]]): Cached
+            (xcenter, width, depth) of the nodes placed so far, keyed by
+            (x1, y1); xcenter and width are fractions of the drawing width.
+    """
+
+    def __init__(self):
+        """Initialize an empty layout."""
+        self.positions = {}
+        self._root = None  # Root the cached positions belong to
+
+    def update(self, root):
+        """
+        Start laying out root: if it is not the root of the cached positions,
+        they are dropped and only the root is placed.
+
+        Args:
+            root (SnapshotNode | None): Root of the tree to draw. Snapshots
+                are immutable, so the same root always has the same layout.
+        """
+        if root is self._root:
+            return
+        self._root = root
+        self.positions.clear()
+        if root is not None:
+            self.positions[(root.get_x1(), root.get_y1())] = (0.5, 1.0, 0)
+
+    def place_children(self, node):
+        """
+        Place the children of a node that is already placed.
+
+        Returns:
+            list[tuple]: (child, (xcenter, width, depth)) for every child of node.
+        """
+        xcenter, width, depth = self.positions[(node.get_x1(), node.get_y1())]
+        left, right = node.get_left(), node.get_right()
+        if left is not None and right is not None:
+            quarter = width / 4
+            placed = [(left, (xcenter - quarter, width / 2, depth + 1)),
+                      (right, (xcenter + quarter, width / 2, depth + 1))]
+        elif left is not None or right is not None:
+            placed = [(left or right, (xcenter, width, depth + 1))]
+        else:
+            placed = []
+        for child, position in placed:
+            self.positions[(child.get_x1(), child.get_y1())] = position
+        return placed
+
+
+class TreeViewport:
+    """
+    Zoom and pan of the tree panel.
+
+    Panel coordinates are the pixels of the panel at zoom 1. Horizontally a
+    point is shown at x * zoom - pan_x; vertically the zoom is capped at
+    MAX_ZOOM_Y, because tree levels double in width but not in height, so
+    deep levels become readable without spreading the rows out of view.
+    Viewports are immutable: zooming or panning returns a new one, so the
+    render thread can read it without locking.
+
+    Attributes:
+        MIN_ZOOM (float): Smallest zoom (the whole tree fits the panel).
+        MAX_ZOOM (float): Largest horizontal zoom.
+        MAX_ZOOM_Y (float): Largest vertical zoom.
+        zoom (float): Current horizontal zoom factor.
+        pan_x (float): Horizontal scroll in screen pixels.
+        pan_y (float): Vertical scroll in screen pixels.
+    """
+
+    MIN_ZOOM = 1.0
+    MAX_ZOOM = 1024.0
+    MAX_ZOOM_Y = 4.0
+
+    __slots__ = ("zoom", "pan_x", "pan_y")
+
+    def __init__(self, zoom=1.0, pan_x=0.0, pan_y=0.0):
+        """Initialize a viewport; the default one shows the whole panel."""
+        self.zoom = zoom
+        self.pan_x = pan_x
+        self.pan_y = pan_y
+
+    @property
+    def zoom_y(self):
+        """Return the vertical zoom factor."""
+        return min(self.zoom, self.MAX_ZOOM_Y)
+
+    def to_pixels(self, x, y):
+        """Convert panel coordinates to integer screen pixels."""
+        return int(x * self.zoom - self.pan_x), int(y * self.zoom_y - self.pan_y)
+
+    def visible_area(self, width, height):
+        """
+        Return the part of the panel shown on a surface of the given size.
+
+        Returns:
+            tuple[float, float, float, float]: (left, top, right, bottom) in panel coordinates.
+        """
+        zoom_y = self.zoom_y
+        return (self.pan_x / self.zoom, self.pan_y / zoom_y,
+                (self.pan_x + width) / self.zoom, (self.pan_y + height) / zoom_y)
+
+    def zoomed(self, anchor, factor, size):
+        """
+        Return a viewport zoomed by factor, keeping the screen point anchor fixed.
+
+        Args:
+            anchor (tuple[int, int]): Screen point relative to the panel surface.
+            factor (float): Zoom multiplier (> 1 zooms in).
+            size (tuple[int, int]): Size of the panel surface.
+        """
+        zoomed = TreeViewport(min(max(self.zoom * factor, self.MIN_ZOOM), self.MAX_ZOOM))
+        ax, ay = anchor
+        pan_x = (ax + self.pan_x) * zoomed.zoom / self.zoom - ax
+        pan_y = (ay + self.pan_y) * zoomed.zoom_y / self.zoom_y - ay
+        return self._clamped(zoomed.zoom, pan_x, pan_y, size)
+
+    def panned(self, dx, dy, size):
+        """Return a viewport whose content moved by (dx, dy) screen pixels."""
+        return self._clamped(self.zoom, self.pan_x - dx, self.pan_y - dy, size)
+
+    def _clamped(self, zoom, pan_x, pan_y, size):
+        """Build a viewport that does not scroll past the panel edges."""
+        width, height = size
+        pan_x = min(max(pan_x, 0.0), width * (zoom - 1))
+        pan_y = min(max(pan_y, 0.0), height * (min(zoom, self.MAX_ZOOM_Y) - 1))
+        return TreeViewport(zoom, pan_x, pan_y)
+
+    def __eq__(self, other):
+        return (isinstance(other, TreeViewport)
+                and (self.zoom, self.pan_x, self.pan_y) == (other.zoom, other.pan_x, other.pan_y))
+
+    def __hash__(self):
+        return hash((self.zoom, self.pan_x, self.pan_y))
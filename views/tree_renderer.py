@@ -0,0 +1,316 @@
+import pygame
+from utils.lru_cache import LRUCache
+from views.tree_layout import TreeLayout, TreeViewport
+
+
+class PygameTreeRenderer:
+    """
+    Draws the AVL tree straight from its nodes with pygame.draw.
+
+    Keeps the look of the matplotlib backend (light blue nodes, red highlights,
+    gray edges, "(x,y)" labels) at a fraction of the cost: label surfaces are
+    rendered once and cached, node positions come from a lazy TreeLayout,
+    and no intermediate figure is rasterised.
+
+    The tree is drawn through a TreeViewport (zoom and pan). Only subtrees
+    that reach the visible area are visited and laid out, and subtrees that
+    would be too narrow to read, or too deep below the top of the view, are
+    collapsed into a summary glyph with their node count and height. The work
+    per render is therefore bounded by the panel size, not by the size of the
+    tree.
+
+    Attributes:
+        WIDTH (int): Width of the rendered surface.
+        HEIGHT (int): Height of the rendered surface.
+        NODE_RADIUS (int): Radius of a node circle in pixels.
+        MARGIN (int): Free space around the drawing in pixels.
+        TITLE_HEIGHT (int): Space reserved above the tree for the title.
+        COLLAPSE_WIDTH (int): Subtrees narrower than this on screen are summarized.
+        LOD_DEPTH (int): Levels drawn below the top of the view before summarizing.
+        CAN_RECOLOR (bool): recolor() redraws a single node in place.
+    """
+
+    WIDTH = 480
+    HEIGHT = 400
+    NODE_RADIUS = 13
+    MARGIN = 24
+    TITLE_HEIGHT = 24
+    COLLAPSE_WIDTH = 48
+    LOD_DEPTH = 6
+    CAN_RECOLOR = True
+
+    BACKGROUND = (255, 255, 255)
+    NODE_COLOR = (173, 216, 230)      # matplotlib "lightblue"
+    HIGHLIGHT_COLOR = (255, 0, 0)     # matplotlib "red"
+    EDGE_COLOR = (128, 128, 128)      # matplotlib "gray"
+    TEXT_COLOR = (0, 0, 0)
+    EMPTY_COLOR = (128, 128, 128)
+    SUMMARY_COLOR = (210, 210, 210)
+
+    def __init__(self):
+        """Initialize fonts and the label cache."""
+        self.label_font = pygame.font.Font(None, 12)
+        self.label_font.set_bold(True)
+        self.title_font = pygame.font.Font(None, 18)
+        self.empty_font = pygame.font.Font(None, 32)
+        self.labels = LRUCache(max_size=2048)
+        self.layout = TreeLayout()
+        self.viewport = TreeViewport()  # Viewport of the last render
+        self._row_height = 0  # Panel spacing between levels in the last render
+        self._drawn = {}  # Screen point of every node drawn in the last render
+
+    def render(self, root, highlight_nodes=(), viewport=None):
+        """
+        Render the tree into a new surface.
+
+        Args:
+            root (SnapshotNode | None): Root of the tree to draw.
+            highlight_nodes (Iterable[str]): Node ids ("(x1,y1)") drawn in red.
+            viewport (TreeViewport, optional): Zoom and pan. Defaults to the whole tree.
+
+        Returns:
+            pygame.Surface: Surface of size (WIDTH, HEIGHT).
+        """
+        surface = pygame.Surface((self.WIDTH, self.HEIGHT))
+        surface.fill(self.BACKGROUND)
+
+        self.layout.update(root)
+        self.viewport = viewport or TreeViewport()
+        self._drawn = {}
+        if root is None:
+            text = self._label("Empty Tree", self.EMPTY_COLOR, self.empty_font)
+            surface.blit(text, text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2)))
+            return surface
+
+        self._row_height = (self.HEIGHT - self.TITLE_HEIGHT - 2 * self.MARGIN) / max(root.get_height() - 1, 1)
+        nodes, summaries = self._visible_nodes(surface, root)
+
+        highlighted = set(highlight_nodes)
+        for node, point in summaries:
+            self._draw_summary(surface, node, point)
+        for node, point in nodes:
+            node_id = f"({node.get_x1()},{node.get_y1()})"
+            self._draw_node(surface, node_id, point, node_id in highlighted)
+            self._drawn[(node.get_x1(), node.get_y1())] = point
+
+        # Title band on top, so scrolled nodes pass underneath it
+        surface.fill(self.BACKGROUND, (0, 0, self.WIDTH, self.TITLE_HEIGHT))
+        title = "AVL Tree" if self.viewport.zoom == 1 else f"AVL Tree (x{self.viewport.zoom:.1f})"
+        title = self._label(title, self.TEXT_COLOR, self.title_font)
+        surface.blit(title, title.get_rect(center=(self.WIDTH // 2, self.TITLE_HEIGHT // 2)))
+        return surface
+
+    def _visible_nodes(self, surface, root):
+        """
+        Walk and lay out the subtrees that reach the visible area, and draw their edges.
+
+        Returns:
+            tuple[list, list]: (node, point) pairs to draw as nodes, and
+            (node, point) pairs to draw as collapsed subtrees.
+        """
+        zoom = self.viewport.zoom
+        usable_width = self.WIDTH - 2 * self.MARGIN
+        top = self.TITLE_HEIGHT + self.MARGIN
+        left, view_top, right, bottom = self.viewport.visible_area(self.WIDTH, self.HEIGHT)
+        pad = self.NODE_RADIUS / self.viewport.zoom_y
+        max_depth = max(view_top - top, 0) / self._row_height + self.LOD_DEPTH
+
+        def reaches_view(position):
+            xcenter, width, depth = position
+            return (self.MARGIN + (xcenter - width / 2) * usable_width <= right + pad
+                    and self.MARGIN + (xcenter + width / 2) * usable_width >= left - pad
+                    and top + depth * self._row_height <= bottom + pad)
+
+        # Edges first so nodes are drawn on top of them
+        nodes, summaries = [], []
+        root_key = (root.get_x1(), root.get_y1())
+        stack = [(root, self._to_pixels(root_key))]
+        while stack:
+            node, point = stack.pop()
+            _, width, depth = self.layout.positions[(node.get_x1(), node.get_y1())]
+            if width * usable_width * zoom < self.COLLAPSE_WIDTH or depth > max_depth:
+                summaries.append((node, point))
+                continue
+            nodes.append((node, point))
+            for child, position in self.layout.place_children(node):
+                child_point = self._to_pixels((child.get_x1(), child.get_y1()))
+                pygame.draw.line(surface, self.EDGE_COLOR, point, child_point)
+                if reaches_view(position):
+                    stack.append((child, child_point))
+        return nodes, summaries
+
+    def recolor(self, surface, node_id, highlight_nodes=()):
+        """
+        Redraw a single node of a surface produced by render() in its current
+        highlight state, reusing the cached layout instead of rendering again.
+
+        Args:
+            surface (pygame.Surface): Surface returned by the last render.
+            node_id (str): Id of the node to redraw ("(x1,y1)").
+            highlight_nodes (Iterable[str]): Node ids drawn in red.
+
+        Returns:
+            pygame.Surface: The same surface, updated in place.
+        """
+        x1, y1 = node_id.strip("()").split(",")
+        point = self._drawn.get((int(x1), int(y1)))
+        if point is not None:
+            self._draw_node(surface, node_id, point, node_id in highlight_nodes)
+        return surface
+
+    def _draw_node(self, surface, node_id, point, highlighted):
+        """Draw one node circle and its label."""
+        color = self.HIGHLIGHT_COLOR if highlighted else self.NODE_COLOR
+        pygame.draw.circle(surface, color, point, self.NODE_RADIUS)
+        label = self._label(node_id, self.TEXT_COLOR, self.label_font)
+        surface.blit(label, label.get_rect(center=point))
+
+    def _draw_summary(self, surface, node, point):
+        """
+        Draw a collapsed subtree as a triangle with its height inside and its
+        node count below (thousands abbreviated, e.g. "12k").
+        """
+        x, y = point
+        r = self.NODE_RADIUS
+        triangle = ((x, y - r), (x - r, y + r), (x + r, y + r))
+        pygame.draw.polygon(surface, self.SUMMARY_COLOR, triangle)
+        pygame.draw.polygon(surface, self.EDGE_COLOR, triangle, 1)
+        height = self._label(f"h{node.get_height()}", self.TEXT_COLOR, self.label_font)
+        surface.blit(height, height.get_rect(midbottom=(x, y + r)))
+        size = node.get_size()
+        count = self._label(str(size) if size < 1000 else f"{size // 1000}k", self.TEXT_COLOR, self.label_font)
+        surface.blit(count, count.get_rect(midtop=(x, y + r + 1)))
+
+    def _to_pixels(self, key):
+        """Convert the cached layout position of a node key into screen pixels."""
+        xcenter, _, depth = self.layout.positions[key]
+        usable_width = self.WIDTH - 2 * self.MARGIN
+        top = self.TITLE_HEIGHT + self.MARGIN
+        return self.viewport.to_pixels(self.MARGIN + xcenter * usable_width,
+                                       top + depth * self._row_height)
+
+    def _label(self, text, color, font):
+        """Return a cached rendered label."""
+        return self.labels.get_or_create((id(font), text, color),
+                                         lambda: font.render(text, True, color))
+
+
+class MatplotlibTreeRenderer:
+    """
+    Optional backend that draws the tree with networkx and matplotlib.
+    Both packages are only imported when this renderer is created.
+
+    Attributes:
+        CAN_RECOLOR (bool): False, a single node cannot be redrawn; highlight
+            changes need a full render (done on the render thread).
+    """
+
+    CAN_RECOLOR = False
+
+    def __init__(self):
+        """Import the optional plotting dependencies."""
+        import matplotlib.pyplot as plt
+        import matplotlib.backends.backend_agg as agg
+        import networkx as nx
+        self.plt = plt
+        self.agg = agg
+        self.nx = nx
+
+    def render(self, root, highlight_nodes=(), viewport=None):
+        """
+        Creates a Pygame surface with the current AVL tree drawn using matplotlib.
+        Highlights nodes listed in highlight_nodes; the whole tree is always
+        drawn, so viewport is ignored.
+        """
+        plt, nx = self.plt, self.nx
+        if not root:
+            # Usar tamaño pequeño para que no expanda toda la ventana
+            fig, ax = plt.subplots(figsize=(6, 5), dpi=80)
+            ax.text(0.5, 0.5, '🌳 Empty Tree', ha='center', va='center',
+                    fontsize=20, transform=ax.transAxes, color='gray')
+            ax.axis('off')
+        else:
+            graph = nx.DiGraph()
+            self._add_edges(graph, root)
+            root_id = f"({root.get_x1()},{root.get_y1()})"
+
+            pos = self.hierarchy_pos(graph, root=root_id)
+            labels = {n: n for n in graph.nodes()}
+
+            fig, ax = plt.subplots(figsize=(6, 5), dpi=80)
+            node_colors = ["red" if n in highlight_nodes else "lightblue" for n in graph.nodes()]
+
+            nx.draw(
+                graph, pos, with_labels=True, labels=labels,
+                node_size=600, node_color=node_colors,
+                font_size=6, font_weight="bold", arrows=False,
+                ax=ax, edge_color='gray', linewidths=1
+            )
+            ax.set_title("AVL Tree", fontsize=10)
+            ax.axis('off')
+
+        # Convert matplotlib figure to Pygame surface
+        canvas = self.agg.FigureCanvasAgg(fig)
+        canvas.draw()
+        renderer = canvas.get_renderer()
+        raw_data = renderer.buffer_rgba()
+        size = canvas.get_width_height()
+        surface = pygame.image.frombuffer(raw_data, size, 'RGBA')
+        plt.close(fig)
+        return surface
+
+    def _add_edges(self, graph, node):
+        """Recursively adds nodes and edges to the NetworkX graph."""
+        if not node:
+            return
+        node_id = f"({node.get_x1()},{node.get_y1()})"
+        graph.add_node(node_id)
+        if node.get_left():
+            left_id = f"({node.get_left().get_x1()},{node.get_left().get_y1()})"
+            graph.add_edge(node_id, left_id)
+            self._add_edges(graph, node.get_left())
+        if node.get_right():
+            right_id = f"({node.get_right().get_x1()},{node.get_right().get_y1()})"
+            graph.add_edge(node_id, right_id)
+            self._add_edges(graph, node.get_right())
+
+    def hierarchy_pos(self, G, root=None, width=1., vert_gap=0.2,
+                      vert_loc=0, xcenter=0.5, pos=None, parent=None):
+        """
+        Computes a hierarchical layout for NetworkX graphs.
+        """
+        if pos is None:
+            pos = {root: (xcenter, vert_loc)}
+        else:
+            pos[root] = (xcenter, vert_loc)
+        neighbors = list(G.neighbors(root))
+        if parent is not None and parent in neighbors:
+            neighbors.remove(parent)
+        if len(neighbors) != 0:
+            dx = width / len(neighbors)
+            nextx = xcenter - width / 2 - dx / 2
+            for neighbor in neighbors:
+                nextx += dx
+                pos = self.hierarchy_pos(G, neighbor, width=dx, vert_gap=vert_gap,
+                                         vert_loc=vert_loc - vert_gap, xcenter=nextx,
+                                         pos=pos, parent=root)
+        return pos
+
+
+TREE_RENDERERS = {
+    "pygame": PygameTreeRenderer,
+    "matplotlib": MatplotlibTreeRenderer,
+}
+
+
+def create_tree_renderer(backend="pygame"):
+    """
+    Create a tree renderer by backend name.
+
+    Args:
+        backend (str, optional): "pygame" or "matplotlib". Defaults to "pygame".
+
+    Returns:
+        PygameTreeRenderer | MatplotlibTreeRenderer: The renderer.
+    """
+    return TREE_RENDERERS[backend]()
@@ -1,9 +1,8 @@
-import sys
-import time
+import threading
 import pygame
-import matplotlib.pyplot as plt
-import matplotlib.backends.backend_agg as agg
-import networkx as nx
+from views.tree_layout import TreeViewport
+from views.tree_renderer import create_tree_renderer
+from utils.text_cache import get_font, render_text
 
 class TreeView:
     """
@@ -17,34 +16,65 @@ class TreeView:
         avl_controller (AVLTreeController): Controller managing the AVL tree.
         game_width (int): Width of the game area, used to align the tree panel.
         screen (pygame.Surface): Pygame surface to draw on.
-        tree_surface (pygame.Surface): Surface with the rendered tree image.
+        renderer (PygameTreeRenderer | MatplotlibTreeRenderer): Backend that draws the tree.
+        tree_surface (pygame.Surface): Surface with the rendered tree image (read-only).
+        snapshot (TreeSnapshot | None): Snapshot drawn on tree_surface.
+        render_event (threading.Event): Set when the render thread has work to do.
+        viewport (TreeViewport): Zoom and pan of the tree panel (wheel zooms,
+            dragging pans, right click resets).
         dirty (bool): Flag indicating that the tree needs to be redrawn.
         buttons (dict): Rects for traversal buttons (Inorder, Preorder, Postorder).
         highlight_nodes (list): Nodes to highlight during traversal animation.
         animation_delay_ms (int): Delay between animation steps in milliseconds.
+        animation_queue (list): Node ids still to be highlighted by the running animation.
+        next_animation_ms (int | None): Time of the next animation step, None when idle.
         inputs (dict): Rects and text for graphical input fields.
         active_input (str): Currently active input field.
         font (pygame.font.Font): Font used for rendering text.
+        controls_rect (pygame.Rect): Screen area of the buttons and inputs, which
+            are pre-rendered into one layer rebuilt only when an input text changes.
+        panel_rect (pygame.Rect): Screen area of the whole tree panel.
     """
 
     TREE_WIDTH = 500
     HEIGHT = 800
     tree_y_pos = 20
+    ZOOM_STEP = 1.25  # Zoom factor per mouse wheel notch
 
-    def __init__(self, avl_controller, game_width):
+    def __init__(self, avl_controller, game_width, backend="pygame"):
         self.avl_controller = avl_controller
         self.game_width = game_width
         self.screen = None
-        self.tree_surface = None
+        self.renderer = create_tree_renderer(backend)
+        self.snapshot = None
+        self.render_event = threading.Event()
+        self._published = (None, None)  # (version, surface), swapped as a whole
+        self._pending_snapshot = None  # Latest snapshot not rendered yet
+        self._pending_lock = threading.Lock()
+        self._render_lock = threading.Lock()  # Guards the renderer and its layout
+        self.viewport = TreeViewport()
+        self._drag_pos = None  # Last mouse position while panning
         self.dirty = True  # Flag to redraw tree when it changes
         self.buttons = self._create_buttons()
         self.highlight_nodes = []  # Nodes to highlight during traversal (format "(x,y)")
         self.animation_delay_ms = 500  # milliseconds between animation steps
+        self.animation_queue = []
+        self.next_animation_ms = None
 
         # Graphical input fields
         self.inputs = self._create_inputs()
         self.active_input = None  # Currently edited input
-        self.font = pygame.font.SysFont("Arial", 16, bold=True)
+        self.font = get_font("Arial", 16, bold=True)
+        rects = list(self.buttons.values()) + [info["rect"] for info in self.inputs.values()]
+        self.controls_rect = rects[0].unionall(rects[1:]).inflate(8, 8)
+        self._controls_layer = None
+        self._controls_key = None  # Input texts drawn on the controls layer
+
+        # Dirty-region tracking: what is currently on the screen
+        self.panel_rect = pygame.Rect(self.game_width, 0, self.TREE_WIDTH, self.HEIGHT)
+        self._panel_drawn = False
+        self._drawn_published = None  # (version, surface) pair last blitted
+        self._drawn_controls_key = None
 
     def set_screen(self, screen):
         """Sets the Pygame surface for rendering."""
@@ -54,6 +84,47 @@ class TreeView:
         """Marks the tree as needing a redraw."""
         self.dirty = True
 
+    @property
+    def tree_surface(self):
+        """Return the last finished tree surface, or None before the first render."""
+        return self._published[1]
+
+    def submit_snapshot(self, snapshot):
+        """
+        Hand a tree snapshot to the render thread (called by the game loop).
+        A snapshot that was never rendered is replaced.
+
+        Args:
+            snapshot (TreeSnapshot | None): Snapshot from publish_snapshot(); None is ignored.
+        """
+        if snapshot is None:
+            return
+        with self._pending_lock:
+            self._pending_snapshot = snapshot
+        self.render_event.set()
+
+    def request_render(self):
+        """Ask the render thread to redraw the current snapshot (e.g. new highlights)."""
+        self.render_event.set()
+
+    def render_pending(self):
+        """
+        Render the latest submitted snapshot, or redraw the current one, and
+        swap the finished surface in. Runs on the render thread; it never
+        touches the live AVL tree.
+        """
+        with self._pending_lock:
+            snapshot, self._pending_snapshot = self._pending_snapshot, None
+        if snapshot is None:
+            snapshot = self.snapshot
+        if snapshot is None:
+            return
+
+        with self._render_lock:
+            surface = self.renderer.render(snapshot.root, list(self.highlight_nodes), self.viewport)
+            self.snapshot = snapshot
+            self._published = (snapshot.version, surface)
+
     def _create_inputs(self):
         """
         Creates input fields for range queries and the 'Consult' button.
@@ -72,101 +143,123 @@ class TreeView:
         }
         return inputs
 
-    def draw_inputs(self):
-        """Draws input fields and the 'Consult' button on the screen."""
+    def _text(self, text):
+        """Return a cached rendering of text in the panel font."""
+        return render_text(text, 16, (0, 0, 0), "Arial", True)
+
+    def draw_inputs(self, target=None, offset=(0, 0)):
+        """
+        Draws input fields and the 'Consult' button.
+
+        Args:
+            target (pygame.Surface, optional): Surface to draw on. Defaults to the screen.
+            offset (tuple[int, int], optional): Screen position of the target's origin.
+        """
+        target = self.screen if target is None else target
         for key, info in self.inputs.items():
-            rect = info["rect"]
+            rect = info["rect"].move(-offset[0], -offset[1])
             if key == "Consult":
-                pygame.draw.rect(self.screen, (180, 220, 180), rect)
-                pygame.draw.rect(self.screen, (0, 0, 0), rect, 2)
-                label = self.font.render("Consult Range", True, (0, 0, 0))
-                self.screen.blit(label, (rect.x + 5, rect.y + 5))
+                pygame.draw.rect(target, (180, 220, 180), rect)
+                pygame.draw.rect(target, (0, 0, 0), rect, 2)
+                target.blit(self._text("Consult Range"), (rect.x + 5, rect.y + 5))
             else:
-                pygame.draw.rect(self.screen, (255, 255, 255), rect)
-                pygame.draw.rect(self.screen, (0, 0, 0), rect, 2)
-                text_surf = self.font.render(info["text"], True, (0, 0, 0))
-                self.screen.blit(text_surf, (rect.x + 5, rect.y + 5))
+                pygame.draw.rect(target, (255, 255, 255), rect)
+                pygame.draw.rect(target, (0, 0, 0), rect, 2)
+                target.blit(self._text(info["text"]), (rect.x + 5, rect.y + 5))
 
                 # Small label for the input
-                label = self.font.render(key, True, (0, 0, 0))
-                self.screen.blit(label, (rect.x - 50, rect.y + 5))
-
-    def create_tree_surface(self):
+                target.blit(self._text(key), (rect.x - 50, rect.y + 5))
+
+    def _get_controls_layer(self):
+        """Return the pre-rendered buttons and inputs, redrawn only if an input text changed."""
+        key = tuple(info.get("text") for info in self.inputs.values())
+        if key != self._controls_key:
+            if self._controls_layer is None:
+                self._controls_layer = pygame.Surface(self.controls_rect.size)
+            self._controls_layer.fill((240, 240, 240))
+            self.draw_buttons(self._controls_layer, self.controls_rect.topleft)
+            self.draw_inputs(self._controls_layer, self.controls_rect.topleft)
+            self._controls_key = key
+        return self._controls_layer
+
+    def draw_tree_area(self, full=False):
         """
-        Creates a Pygame surface with the current AVL tree drawn using matplotlib.
-        Highlights nodes if specified in self.highlight_nodes.
+        Draws the background, the AVL tree, and all buttons/inputs.
+        Only the parts that changed since the previous call are drawn again.
+
+        Args:
+            full (bool, optional): Redraw the whole panel. Defaults to False.
+
+        Returns:
+            list[pygame.Rect]: Screen areas that were redrawn.
         """
-        root = self.avl_controller.tree.get_root()
-        if not root:
-            # Usar tamaño pequeño para que no expanda toda la ventana
-            fig, ax = plt.subplots(figsize=(6, 5), dpi=80)
-            ax.text(0.5, 0.5, '🌳 Empty Tree', ha='center', va='center',
-                    fontsize=20, transform=ax.transAxes, color='gray')
-            ax.axis('off')
-        else:
-            graph = nx.DiGraph()
-            self._add_edges(graph, root)
-            root_id = f"({root.get_x1()},{root.get_y1()})"
-
-            pos = self.hierarchy_pos(graph, root=root_id)
-            labels = {n: n for n in graph.nodes()}
-
-            fig, ax = plt.subplots(figsize=(6, 5), dpi=80)
-            node_colors = ["red" if n in self.highlight_nodes else "lightblue" for n in graph.nodes()]
-
-            nx.draw(
-                graph, pos, with_labels=True, labels=labels,
-                node_size=600, node_color=node_colors,
-                font_size=6, font_weight="bold", arrows=False,
-                ax=ax, edge_color='gray', linewidths=1
-            )
-            ax.set_title("AVL Tree", fontsize=10)
-            ax.axis('off')
-
-        # Convert matplotlib figure to Pygame surface
-        canvas = agg.FigureCanvasAgg(fig)
-        canvas.draw()
-        renderer = canvas.get_renderer()
-        raw_data = renderer.buffer_rgba()
-        size = canvas.get_width_height()
-        surface = pygame.image.frombuffer(raw_data, size, 'RGBA')
-        plt.close(fig)
-        return surface
-
-    def _add_edges(self, graph, node):
-        """Recursively adds nodes and edges to the NetworkX graph."""
-        if not node:
-            return
-        node_id = f"({node.get_x1()},{node.get_y1()})"
-        graph.add_node(node_id)
-        if node.get_left():
-            left_id = f"({node.get_left().get_x1()},{node.get_left().get_y1()})"
-            graph.add_edge(node_id, left_id)
-            self._add_edges(graph, node.get_left())
-        if node.get_right():
-            right_id = f"({node.get_right().get_x1()},{node.get_right().get_y1()})"
-            graph.add_edge(node_id, right_id)
-            self._add_edges(graph, node.get_right())
-
-    def draw_tree_area(self):
-        """Draws the background, the AVL tree, and all buttons/inputs."""
-        pygame.draw.rect(self.screen, (240, 240, 240),
-                         (self.game_width, 0, self.TREE_WIDTH, self.HEIGHT))
-        pygame.draw.line(self.screen, (0, 0, 0),
-                         (self.game_width, 0), (self.game_width, self.HEIGHT), 3)
-
-        if self.dirty or self.tree_surface is None:
-            self.tree_surface = self.create_tree_surface()
+        if self.dirty:
+            self.request_render()
             self.dirty = False
 
-        if self.tree_surface:
-            tree_x = self.game_width + (self.TREE_WIDTH - self.tree_surface.get_width()) // 2
-            tree_y = self.tree_y_pos
-            self.screen.blit(self.tree_surface, (tree_x, tree_y))
+        rects = []
+        if full or not self._panel_drawn:
+            pygame.draw.rect(self.screen, (240, 240, 240), self.panel_rect)
+            pygame.draw.line(self.screen, (0, 0, 0),
+                             (self.game_width + 1, 0), (self.game_width + 1, self.HEIGHT), 3)
+            self._panel_drawn = True
+            self._drawn_published = self._drawn_controls_key = None
+            rects.append(self.panel_rect)
+
+        # The render thread swaps in a new pair for every new or recoloured surface
+        published = self._published
+        if published is not self._drawn_published and published[1] is not None:
+            tree_rect = self._tree_rect()
+            self.screen.blit(published[1], tree_rect)
+            self._drawn_published = published
+            rects.append(tree_rect)
 
         # Draw buttons and inputs
-        self.draw_buttons()
-        self.draw_inputs()
+        controls = self._get_controls_layer()
+        if self._controls_key != self._drawn_controls_key:
+            self.screen.blit(controls, self.controls_rect)
+            self._drawn_controls_key = self._controls_key
+            rects.append(self.controls_rect)
+        return rects
+
+    def _tree_rect(self):
+        """Return the screen rect of the tree surface, or None before the first render."""
+        tree_surface = self.tree_surface
+        if tree_surface is None:
+            return None
+        tree_x = self.game_width + (self.TREE_WIDTH - tree_surface.get_width()) // 2
+        return tree_surface.get_rect(topleft=(tree_x, self.tree_y_pos))
+
+    def handle_viewport_event(self, event):
+        """
+        Zooms the tree panel with the mouse wheel, pans it by dragging with
+        the left button and resets it with a right click.
+        """
+        rect = self._tree_rect()
+        if rect is None:
+            return
+        if event.type == pygame.MOUSEWHEEL:
+            pos = pygame.mouse.get_pos()
+            if rect.collidepoint(pos):
+                anchor = (pos[0] - rect.x, pos[1] - rect.y)
+                self._set_viewport(self.viewport.zoomed(anchor, self.ZOOM_STEP ** event.y, rect.size))
+        elif event.type == pygame.MOUSEBUTTONDOWN and rect.collidepoint(event.pos):
+            if event.button == 1:
+                self._drag_pos = event.pos
+            elif event.button == 3:
+                self._set_viewport(TreeViewport())
+        elif event.type == pygame.MOUSEMOTION and self._drag_pos is not None:
+            dx, dy = event.pos[0] - self._drag_pos[0], event.pos[1] - self._drag_pos[1]
+            self._drag_pos = event.pos
+            self._set_viewport(self.viewport.panned(dx, dy, rect.size))
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self._drag_pos = None
+
+    def _set_viewport(self, viewport):
+        """Switch to a new viewport and redraw the tree if it changed."""
+        if viewport != self.viewport:
+            self.viewport = viewport
+            self.request_render()
 
     def _create_buttons(self):
         """Creates buttons for Inorder, Preorder, and Postorder traversal."""
@@ -181,14 +274,20 @@ class TreeView:
         }
         return buttons
 
-    def draw_buttons(self):
-        """Draws traversal buttons on the screen."""
-        font = pygame.font.SysFont("Arial", 16, bold=True)
+    def draw_buttons(self, target=None, offset=(0, 0)):
+        """
+        Draws traversal buttons.
+
+        Args:
+            target (pygame.Surface, optional): Surface to draw on. Defaults to the screen.
+            offset (tuple[int, int], optional): Screen position of the target's origin.
+        """
+        target = self.screen if target is None else target
         for text, rect in self.buttons.items():
-            pygame.draw.rect(self.screen, (200, 200, 200), rect)
-            pygame.draw.rect(self.screen, (0, 0, 0), rect, 2)
-            label = font.render(text, True, (0, 0, 0))
-            self.screen.blit(label, (rect.x + 10, rect.y + 5))
+            rect = rect.move(-offset[0], -offset[1])
+            pygame.draw.rect(target, (200, 200, 200), rect)
+            pygame.draw.rect(target, (0, 0, 0), rect, 2)
+            target.blit(self._text(text), (rect.x + 10, rect.y + 5))
 
     def handle_click(self, pos):
         """Handles mouse click events on buttons and input fields."""
@@ -239,8 +338,8 @@ class TreeView:
 
     def animate_traversal(self, nodes):
         """
-        Animates the traversal of the given list of nodes.
-        nodes: list returned by AVLTreeController (e.g., ["(10,20)", "(5,30)", ...])
+        Starts a traversal animation; it is advanced by update() every frame.
+        nodes: list returned by AVLTreeController (e.g., ["(10, 20)", "(5, 30)", ...])
         """
         normalized = []
         for item in nodes:
@@ -253,54 +352,49 @@ class TreeView:
                     nid = str(item).replace(" ", "")
             normalized.append(nid)
 
-        for nid in normalized:
-            if nid not in self.highlight_nodes:
-                self.highlight_nodes.append(nid)
-
+        # Restart from a clean tree if another animation was running
+        if self.highlight_nodes:
+            self.highlight_nodes.clear()
             self.dirty = True
-            self.tree_surface = self.create_tree_surface()
-
-            tree_x = self.game_width + (self.TREE_WIDTH - self.tree_surface.get_width()) // 2
-            tree_y = self.tree_y_pos
-            self.screen.blit(self.tree_surface, (tree_x, tree_y))
-            self.draw_buttons()
-            pygame.display.flip()
+        self.animation_queue = normalized
+        self.next_animation_ms = pygame.time.get_ticks()
 
-            for ev in pygame.event.get():
-                if ev.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-            pygame.time.wait(int(self.animation_delay_ms))
-
-        # Clear highlights at the end
-        self.highlight_nodes.clear()
-        self.dirty = True
-        self.tree_surface = self.create_tree_surface()
-        tree_x = self.game_width + (self.TREE_WIDTH - self.tree_surface.get_width()) // 2
-        tree_y = 50
-        self.screen.blit(self.tree_surface, (tree_x, tree_y))
-        self.draw_buttons()
-        pygame.display.flip()
-
-    def hierarchy_pos(self, G, root=None, width=1., vert_gap=0.2,
-                      vert_loc=0, xcenter=0.5, pos=None, parent=None):
+    def update(self, now_ms=None):
         """
-        Computes a hierarchical layout for NetworkX graphs.
+        Advances the traversal animation without blocking the game loop.
+        Each step only recolours one node on the current tree surface (renderers
+        that cannot do that redraw the tree on the render thread instead); once
+        the queue is empty and the last delay has passed the highlights are
+        cleared. A step is postponed to the next frame while the render thread
+        is busy.
+
+        Args:
+            now_ms (int, optional): Current time in milliseconds. Defaults to pygame ticks.
         """
-        if pos is None:
-            pos = {root: (xcenter, vert_loc)}
-        else:
-            pos[root] = (xcenter, vert_loc)
-        neighbors = list(G.neighbors(root))
-        if parent is not None and parent in neighbors:
-            neighbors.remove(parent)
-        if len(neighbors) != 0:
-            dx = width / len(neighbors)
-            nextx = xcenter - width / 2 - dx / 2
-            for neighbor in neighbors:
-                nextx += dx
-                pos = self.hierarchy_pos(G, neighbor, width=dx, vert_gap=vert_gap,
-                                         vert_loc=vert_loc - vert_gap, xcenter=nextx,
-                                         pos=pos, parent=root)
-        return pos
\ No newline at end of file
+        if self.next_animation_ms is None:
+            return
+        now_ms = pygame.time.get_ticks() if now_ms is None else now_ms
+        if now_ms < self.next_animation_ms:
+            return
+
+        if not self.animation_queue:
+            # Clear highlights at the end
+            self.highlight_nodes.clear()
+            self.next_animation_ms = None
+            self.dirty = True
+            return
+
+        if not self._render_lock.acquire(blocking=False):
+            return
+        try:
+            nid = self.animation_queue.pop(0)
+            if nid not in self.highlight_nodes:
+                self.highlight_nodes.append(nid)
+            version, surface = self._published
+            if surface is not None and self.renderer.CAN_RECOLOR:
+                self._published = (version, self.renderer.recolor(surface, nid, self.highlight_nodes))
+        finally:
+            self._render_lock.release()
+        if not self.renderer.CAN_RECOLOR:
+            self.request_render()
+        self.next_animation_ms = now_ms + self.animation_delay_ms